@@ -1,20 +1,27 @@
 from fastapi import FastAPI, File, UploadFile, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 import uvicorn
+import csv
+import io
 import logging
-from typing import Dict, Any
+import mmap
+from contextlib import asynccontextmanager
+from typing import Iterator, Optional, Tuple
 import asyncio
 
 try:
     from services import PDFProcessor
-    from models import ProcessingResult
+    from services.pdf_processor import create_worker_pool, warm_up, PDFProcessingError, PDF_SIGNATURE
+    from models import ProcessingResult, ProcessedStatement
     from utils import DataCleaner
+    from utils.cache import LRUCache, content_digest
 except ImportError:
     # Fallback for when running as script
-    from services.pdf_processor import PDFProcessor
-    from models.statement_data import ProcessingResult
+    from services.pdf_processor import PDFProcessor, create_worker_pool, warm_up, PDFProcessingError, PDF_SIGNATURE
+    from models.statement_data import ProcessingResult, ProcessedStatement
     from utils.data_cleaner import DataCleaner
+    from utils.cache import LRUCache, content_digest
 
 # Configure logging
 logging.basicConfig(
@@ -23,16 +30,38 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Initialize services
+pdf_processor = PDFProcessor()
+data_cleaner = DataCleaner()
+
+# Successful results keyed by a digest of the uploaded PDF, so re-uploads skip the pipeline
+result_cache = LRUCache(maxsize=32)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up the PDF and regex backends and own the worker pool for the app's lifetime"""
+    warm_up()
+    logger.info("PDF and bank detection backends warmed up")
+
+    worker_pool = create_worker_pool()
+    pdf_processor.executor = worker_pool
+    logger.info("Started PDF extraction worker pool")
+    try:
+        yield
+    finally:
+        pdf_processor.executor = None
+        worker_pool.shutdown()
+        logger.info("Stopped PDF extraction worker pool")
+
+
 app = FastAPI(
     title="PDF to CSV Converter API",
     version="1.0.0",
-    description="Convert credit card statement PDFs to structured CSV data"
+    description="Convert credit card statement PDFs to structured CSV data",
+    lifespan=lifespan
 )
 
-# Initialize services
-pdf_processor = PDFProcessor()
-data_cleaner = DataCleaner()
-
 # CORS middleware to allow requests from Next.js frontend
 app.add_middleware(
     CORSMiddleware,
@@ -50,6 +79,111 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+async def _map_upload(file: UploadFile) -> memoryview:
+    """
+    Expose the spooled upload as a read-only memory map.
+
+    Starlette already holds the upload in a SpooledTemporaryFile, so mapping
+    it avoids copying up to 50MB into a separate bytes object. Release the
+    view with _release_upload once processing is done.
+    """
+    await file.seek(0)
+    try:
+        # Force small uploads out of memory so the file has a descriptor
+        file.file.rollover()
+        mapping = mmap.mmap(file.file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError):
+        # Empty or non file-backed uploads cannot be mapped
+        return memoryview(await file.read())
+    return memoryview(mapping)
+
+
+async def _has_pdf_signature(file: UploadFile) -> bool:
+    """Check the first bytes of an upload for the PDF header without reading the rest"""
+    await file.seek(0)
+    head = await file.read(1024)
+    return head.startswith(PDF_SIGNATURE)
+
+
+def _release_upload(pdf_content: memoryview) -> None:
+    """Release an upload view and close the memory map behind it"""
+    mapping = pdf_content.obj
+    pdf_content.release()
+    if isinstance(mapping, mmap.mmap):
+        mapping.close()
+
+
+async def _read_validated_pdf(file: UploadFile) -> Tuple[Optional[memoryview], Optional[ProcessingResult]]:
+    """
+    Map an uploaded file and run the PDF validation checks.
+
+    Returns:
+        Tuple of (pdf_content, None) on success or (None, error_result).
+        The caller must pass a returned pdf_content to _release_upload.
+    """
+    # Validate file type
+    if file.content_type != "application/pdf":
+        logger.warning(f"Invalid file type: {file.content_type}")
+        return None, ProcessingResult.error_response(
+            "Invalid file type",
+            ["File must be a PDF"]
+        )
+
+    # Validate file size (50MB limit)
+    if file.size and file.size > 50 * 1024 * 1024:  # 50MB
+        logger.warning(f"File too large: {file.size} bytes")
+        return None, ProcessingResult.error_response(
+            "File too large",
+            ["PDF file must be smaller than 50MB"]
+        )
+
+    # Read file content, rejecting non-PDF uploads before mapping the whole file
+    try:
+        if not await _has_pdf_signature(file):
+            logger.warning("PDF validation failed: missing PDF signature")
+            return None, ProcessingResult.error_response(
+                "Invalid PDF file",
+                ["File does not appear to be a valid PDF"]
+            )
+        pdf_content = await _map_upload(file)
+    except Exception as e:
+        logger.error(f"Error reading file content: {e}")
+        return None, ProcessingResult.error_response(
+            "Unable to read PDF file",
+            ["File may be corrupted or inaccessible"]
+        )
+
+    # Validate PDF content
+    is_valid, error_msg = pdf_processor.validate_pdf_content(pdf_content)
+    if not is_valid:
+        logger.warning(f"PDF validation failed: {error_msg}")
+        _release_upload(pdf_content)
+        return None, ProcessingResult.error_response(
+            "Invalid PDF file",
+            [error_msg]
+        )
+
+    return pdf_content, None
+
+
+def _iter_csv(statement: ProcessedStatement) -> Iterator[str]:
+    """Yield a statement as CSV text, one encoded row at a time"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def drain() -> str:
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return chunk
+
+    writer.writerow(statement.headers)
+    yield drain()
+    for row in statement.iter_rows():
+        writer.writerow(row)
+        yield drain()
+
+
 @app.get("/")
 async def root():
     return {"message": "PDF to CSV Converter API is running!"}
@@ -59,56 +193,40 @@ async def upload_pdf_options():
     """Handle CORS preflight requests for upload-pdf"""
     return {"message": "OK"}
 
-@app.post("/upload-pdf", response_model=Dict[str, Any])
+@app.post("/upload-pdf", response_model=ProcessingResult)
 async def upload_pdf(file: UploadFile = File(...)):
     """
     Upload and process a PDF file to extract credit card statement data.
 
+    The handler returns the ProcessingResult itself so FastAPI serializes
+    it straight to JSON bytes through the response model.
+
     Returns:
         JSON response with structured transaction data or error information
     """
     logger.info(f"Received PDF upload: {file.filename} ({file.size} bytes)")
 
+    pdf_content = None
     try:
-        # Validate file type
-        if file.content_type != "application/pdf":
-            logger.warning(f"Invalid file type: {file.content_type}")
-            return ProcessingResult.error_response(
-                "Invalid file type",
-                ["File must be a PDF"]
-            ).dict()
-
-        # Validate file size (50MB limit)
-        if file.size and file.size > 50 * 1024 * 1024:  # 50MB
-            logger.warning(f"File too large: {file.size} bytes")
-            return ProcessingResult.error_response(
-                "File too large",
-                ["PDF file must be smaller than 50MB"]
-            ).dict()
-
-        # Read file content
-        try:
-            pdf_content = await file.read()
-        except Exception as e:
-            logger.error(f"Error reading file content: {e}")
-            return ProcessingResult.error_response(
-                "Unable to read PDF file",
-                ["File may be corrupted or inaccessible"]
-            ).dict()
-
-        # Validate PDF content
-        is_valid, error_msg = pdf_processor.validate_pdf_content(pdf_content)
-        if not is_valid:
-            logger.warning(f"PDF validation failed: {error_msg}")
-            return ProcessingResult.error_response(
-                "Invalid PDF file",
-                [error_msg]
-            ).dict()
+        pdf_content, error_result = await _read_validated_pdf(file)
+        if error_result is not None:
+            return error_result
+
+        # Identical uploads reuse the previous result; hashing up to 50MB
+        # runs off the event loop
+        cache_key = await asyncio.to_thread(content_digest, pdf_content)
+        cached_result = result_cache.get(cache_key)
+        if cached_result is not None:
+            logger.info(f"Returning cached result for {file.filename}")
+            return cached_result
 
         # Process PDF
         logger.info(f"Processing PDF: {file.filename}")
         result = await pdf_processor.process_pdf(pdf_content, file.filename)
 
+        if result.success:
+            result_cache.put(cache_key, result)
+
         if result.success and result.data:
             # Apply data cleaning if processing was successful
             logger.info("Applying data cleaning and standardization")
@@ -117,14 +235,61 @@ async def upload_pdf(file: UploadFile = File(...)):
             logger.info(f"Successfully processed {result.data.get('metadata', {}).get('totalTransactions', 0)} transactions")
 
         logger.info(f"Processing completed for {file.filename}: success={result.success}")
-        return result.dict()
+        return result
 
     except Exception as e:
         logger.error(f"Unexpected error processing PDF: {str(e)}")
         return ProcessingResult.error_response(
             "An unexpected error occurred",
             ["Please try again or contact support if the problem persists"]
-        ).dict()
+        )
+    finally:
+        if pdf_content is not None:
+            _release_upload(pdf_content)
+
+@app.post("/upload-pdf-csv")
+async def upload_pdf_csv(file: UploadFile = File(...)):
+    """
+    Upload a PDF and stream the extracted transactions back as CSV.
+
+    Rows are written as they are produced instead of being materialized
+    into the JSON payload, which keeps memory flat for large statements.
+
+    Returns:
+        text/csv streaming response, or JSON error information
+    """
+    logger.info(f"Received PDF upload for CSV export: {file.filename} ({file.size} bytes)")
+
+    pdf_content = None
+    try:
+        pdf_content, error_result = await _read_validated_pdf(file)
+        if error_result is not None:
+            return error_result.model_dump()
+
+        statement = await pdf_processor.parse_pdf(pdf_content, file.filename)
+
+    except PDFProcessingError as e:
+        logger.error(f"PDF processing error: {str(e)}")
+        return ProcessingResult.error_response(
+            str(e) if e.errors is not None else "Failed to process PDF",
+            e.errors if e.errors is not None else [str(e)]
+        ).model_dump()
+    except Exception as e:
+        logger.error(f"Unexpected error processing PDF: {str(e)}")
+        return ProcessingResult.error_response(
+            "An unexpected error occurred",
+            ["Please try again or contact support if the problem persists"]
+        ).model_dump()
+    finally:
+        if pdf_content is not None:
+            _release_upload(pdf_content)
+
+    csv_name = (file.filename or "statement").rsplit(".", 1)[0] + ".csv"
+    return StreamingResponse(
+        _iter_csv(statement),
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{csv_name}"'}
+    )
 
 @app.get("/health")
 async def health_check():
@@ -153,13 +318,20 @@ async def validate_pdf_only(file: UploadFile = File(...)):
         if file.content_type != "application/pdf":
             return {"valid": False, "error": "File must be a PDF"}
 
-        pdf_content = await file.read()
-        is_valid, error_msg = pdf_processor.validate_pdf_content(pdf_content)
+        if not await _has_pdf_signature(file):
+            return {"valid": False, "error": "File does not appear to be a valid PDF"}
+
+        pdf_content = await _map_upload(file)
+        try:
+            is_valid, error_msg = pdf_processor.validate_pdf_content(pdf_content)
+            size_mb = round(len(pdf_content) / (1024 * 1024), 2)
+        finally:
+            _release_upload(pdf_content)
 
         if is_valid:
             return {
                 "valid": True,
-                "size_mb": round(len(pdf_content) / (1024 * 1024), 2),
+                "size_mb": size_mb,
                 "filename": file.filename
             }
         else:
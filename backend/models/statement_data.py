@@ -1,9 +1,12 @@
 """
 Data models and schemas for credit card statement processing.
 """
+import csv
+import io
+from dataclasses import dataclass
 from datetime import datetime, date
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
+from typing import Iterator, List, Optional, Dict, Any
+from pydantic import BaseModel, Field, field_validator
 from enum import Enum
 
 
@@ -32,24 +35,28 @@ class BankType(str, Enum):
     GENERIC = "generic"
 
 
-class Transaction(BaseModel):
-    """Individual transaction model"""
+@dataclass(slots=True)
+class Transaction:
+    """
+    Individual transaction model.
+
+    A slotted dataclass rather than a pydantic model since parsers build one
+    per statement line. Fields are not type-coerced; only the amount and
+    description are normalized.
+    """
     date: date
     description: str
+    # Currency units, not cents: parsed amounts carry zero to two decimals
+    # and rows render str(amount), e.g. "5.0" or "-100.25"
     amount: float
     transaction_type: TransactionType = TransactionType.OTHER
     category: Optional[str] = None
     reference: Optional[str] = None
 
-    @validator('amount')
-    def validate_amount(cls, v):
-        if v == 0:
-            return v
-        return round(v, 2)
-
-    @validator('description')
-    def clean_description(cls, v):
-        return v.strip() if v else ""
+    def __post_init__(self):
+        # float() raises ValueError on bad input, as validation did
+        self.amount = round(float(self.amount), 2)
+        self.description = self.description.strip() if self.description else ""
 
 
 class StatementMetadata(BaseModel):
@@ -66,7 +73,8 @@ class StatementMetadata(BaseModel):
     available_credit: Optional[str] = None
     total_transactions: int = 0
 
-    @validator('statement_period', 'due_date', 'next_closing', pre=True)
+    @field_validator('statement_period', 'due_date', 'next_closing', mode='before')
+    @classmethod
     def validate_dates(cls, v):
         if v and isinstance(v, str):
             return v.strip()
@@ -88,17 +96,34 @@ class ProcessedStatement(BaseModel):
     @property
     def rows(self) -> List[List[str]]:
         """CSV rows for export"""
-        rows = []
+        # Not cached: transactions are replaced in place by DataCleaner.clean_statement
+        return list(self.iter_rows())
+
+    def iter_rows(self) -> Iterator[List[str]]:
+        """Lazily yield CSV rows, one per transaction"""
         for transaction in self.transactions:
-            rows.append([
-                transaction.date.strftime("%Y-%m-%d"),
+            yield [
+                # isoformat() is YYYY-MM-DD for dates and skips strftime's format parsing
+                transaction.date.isoformat(),
                 transaction.description,
                 str(transaction.amount),
                 transaction.transaction_type.value,
                 transaction.category or "",
                 transaction.reference or ""
-            ])
-        return rows
+            ]
+
+    def to_csv_bytes(self) -> bytes:
+        """
+        Render the statement as UTF-8 CSV.
+
+        Returns:
+            CSV document including the header row
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(self.headers)
+        writer.writerows(self.iter_rows())
+        return buffer.getvalue().encode()
 
 
 class ProcessingResult(BaseModel):
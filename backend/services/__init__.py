@@ -2,6 +2,6 @@
 Services package for PDF to CSV converter.
 """
 from .pdf_processor import PDFProcessor
-from .bank_detection import BankDetector
+from .bank_detection import BankDetector, BANK_DETECTOR
 
-__all__ = ["PDFProcessor", "BankDetector"]
\ No newline at end of file
+__all__ = ["PDFProcessor", "BankDetector", "BANK_DETECTOR"]
\ No newline at end of file
@@ -2,119 +2,207 @@
 Bank detection logic for credit card statements.
 """
 import re
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
 try:
     from ..models import BankType
+    from ..utils.regex_engine import compile_linear
+    from ..utils.cache import LRUCache, text_digest
+    from ..utils.keyword_matcher import KeywordMatcher
 except ImportError:
     from models.statement_data import BankType
+    from utils.regex_engine import compile_linear
+    from utils.cache import LRUCache, text_digest
+    from utils.keyword_matcher import KeywordMatcher
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# Bank detection patterns - order matters for specificity
+_BANK_PATTERNS: Dict[BankType, Tuple[str, ...]] = {
+    BankType.CHASE: (
+        r'chase\s*card\s*services',
+        r'chase\s*bank',
+        r'jp\s*morgan\s*chase',
+        r'chase\.com',
+        r'chase\s*credit\s*card',
+        r'chase\s*sapphire',
+        r'chase\s*freedom',
+        r'chase\s*slate'
+    ),
+    BankType.AMEX: (
+        r'american\s*express',
+        r'amex',
+        r'americanexpress\.com',
+        r'member\s*since',
+        r'membership\s*rewards',
+        r'centurion\s*bank',
+        r'amex\s*card'
+    ),
+    BankType.CITIBANK: (
+        r'citibank',
+        r'citi\s*card',
+        r'citicards',
+        r'citi\.com',
+        r'citibank\s*n\.a\.',
+        r'thank\s*you\s*points',
+        r'citi\s*double\s*cash'
+    ),
+    BankType.BANK_OF_AMERICA: (
+        r'bank\s*of\s*america',
+        r'bankofamerica\.com',
+        r'boa\s*card',
+        r'merrill\s*lynch',
+        r'cash\s*rewards\s*credit\s*card'
+    ),
+    BankType.CAPITAL_ONE: (
+        r'capital\s*one',
+        r'capitalone\.com',
+        r'venture\s*card',
+        r'quicksilver',
+        r'savor\s*card',
+        r'capital\s*one\s*bank'
+    ),
+    BankType.WELLS_FARGO: (
+        r'wells\s*fargo',
+        r'wellsfargo\.com',
+        r'propel\s*card',
+        r'wells\s*fargo\s*bank',
+        r'cash\s*wise'
+    ),
+    BankType.DISCOVER: (
+        r'discover\s*card',
+        r'discover\s*bank',
+        r'discover\.com',
+        r'cashback\s*bonus',
+        r'discover\s*it'
+    ),
+    BankType.BANCO_NACION: (
+        r'banco\s*naci[oó]n',
+        r'naci[oó]n\s*bank',
+        r'mastercard\s*gold',
+        r'nacion\s*mastercard',
+        r'banco\s*de\s*la\s*naci[oó]n',
+        r'bna\s*mastercard',
+        r'compras\s*del\s*mes',
+        r'resumen\s*de\s*cuenta'
+    )
+}
+
+# Lowercase literals of which every primary and secondary pattern contains at
+# least one. ASCII text with none of them cannot match any bank, so regex
+# scoring is skipped.
+_BANK_KEYWORDS: Tuple[str, ...] = (
+    'chase', 'america', 'amex', 'member', 'centurion', 'citi', 'thank',
+    'boa', 'merrill', 'cash', 'capital', 'venture', 'quicksilver', 'savor',
+    'wells', 'propel', 'discover', 'naci', 'mastercard', 'compras', 'resumen',
+    'ultimate', 'fraud', 'pay', 'platinum', 'gold', 'green', 'price'
+)
+
+# Secondary indicators for ambiguous cases
+_SECONDARY_INDICATORS: Dict[BankType, Tuple[str, ...]] = {
+    BankType.CHASE: (
+        r'ultimate\s*rewards',
+        r'pay\s*chase',
+        r'chase\s*online',
+        r'fraud\s*prevention\s*center'
+    ),
+    BankType.AMEX: (
+        r'pay\s*over\s*time',
+        r'platinum\s*card',
+        r'gold\s*card',
+        r'green\s*card'
+    ),
+    BankType.CITIBANK: (
+        r'citi\s*online',
+        r'price\s*rewind',
+        r'citi\s*concierge'
+    )
+}
+
+# Compiled once at import time so detectors never pay the compile cost.
+# RE2 is used when installed so matching stays linear-time on hostile input.
+_COMPILED_BANK: Dict[BankType, Tuple[re.Pattern, ...]] = {
+    bank_type: tuple(compile_linear(pattern, re.IGNORECASE | re.MULTILINE) for pattern in patterns)
+    for bank_type, patterns in _BANK_PATTERNS.items()
+}
+
+_COMPILED_SECONDARY: Dict[BankType, Tuple[re.Pattern, ...]] = {
+    bank_type: tuple(compile_linear(pattern, re.IGNORECASE) for pattern in patterns)
+    for bank_type, patterns in _SECONDARY_INDICATORS.items()
+}
+
+# Per-bank alternation of all secondary indicators. Overlapping indicators can
+# hide each other in one scan, so it only rules out the per-pattern checks.
+_SECONDARY_ANY: Dict[BankType, re.Pattern] = {
+    bank_type: compile_linear("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
+    for bank_type, patterns in _SECONDARY_INDICATORS.items()
+}
+
+# Per-bank alternation of all primary patterns. A search succeeds exactly when
+# some pattern of that bank matches, so banks without a hit are skipped cheaply.
+_PRIMARY_ANY: Dict[BankType, re.Pattern] = {
+    bank_type: compile_linear("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE | re.MULTILINE)
+    for bank_type, patterns in _BANK_PATTERNS.items()
+}
+
+_KEYWORD_PREFILTER = KeywordMatcher((keyword, keyword) for keyword in _BANK_KEYWORDS)
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_DETECTION_KEEP_RE = re.compile(r'[\w\s\.\-@]')
+
+
+# Code points above Latin-1 that the char table remembers; beyond this it
+# classifies them on every lookup instead of growing without bound
+_DETECTION_CHAR_TABLE_EXTRA = 4096
+
+
+class _DetectionCharTable(dict):
+    """str.translate table that blanks characters detection ignores"""
+
+    def __init__(self):
+        super().__init__()
+        # Latin-1 covers the statements we parse, so it is filled in up front
+        for codepoint in range(256):
+            self[codepoint] = self._classify(codepoint)
+        self._limit = len(self) + _DETECTION_CHAR_TABLE_EXTRA
+
+    @staticmethod
+    def _classify(codepoint: int) -> int:
+        return codepoint if _DETECTION_KEEP_RE.match(chr(codepoint)) else ord(' ')
+
+    def __missing__(self, codepoint: int) -> int:
+        mapped = self._classify(codepoint)
+        if len(self) < self._limit:
+            self[codepoint] = mapped
+        return mapped
+
+
+# Shared across calls so common characters are only classified once
+_DETECTION_CHAR_TABLE = _DetectionCharTable()
+
+# Detection results keyed by (digest of cleaned text, confidence threshold)
+_DETECTION_CACHE = LRUCache(maxsize=256)
+
+
+# min(matches * 0.3, 1.0) saturates at four matches of a primary pattern
+_SCORE_SATURATION_MATCHES = 4
+
+
+def _count_matches(pattern: re.Pattern, text: str, limit: Optional[int] = None) -> int:
+    """Count non-overlapping matches without building a list, optionally stopping at limit"""
+    return sum(1 for _ in islice(pattern.finditer(text), limit))
+
+
 class BankDetector:
     """Detects bank type from PDF text content"""
 
     def __init__(self):
-        # Bank detection patterns - order matters for specificity
-        self.bank_patterns = {
-            BankType.CHASE: [
-                r'chase\s*card\s*services',
-                r'chase\s*bank',
-                r'jp\s*morgan\s*chase',
-                r'chase\.com',
-                r'chase\s*credit\s*card',
-                r'chase\s*sapphire',
-                r'chase\s*freedom',
-                r'chase\s*slate'
-            ],
-            BankType.AMEX: [
-                r'american\s*express',
-                r'amex',
-                r'americanexpress\.com',
-                r'member\s*since',
-                r'membership\s*rewards',
-                r'centurion\s*bank',
-                r'amex\s*card'
-            ],
-            BankType.CITIBANK: [
-                r'citibank',
-                r'citi\s*card',
-                r'citicards',
-                r'citi\.com',
-                r'citibank\s*n\.a\.',
-                r'thank\s*you\s*points',
-                r'citi\s*double\s*cash'
-            ],
-            BankType.BANK_OF_AMERICA: [
-                r'bank\s*of\s*america',
-                r'bankofamerica\.com',
-                r'boa\s*card',
-                r'merrill\s*lynch',
-                r'cash\s*rewards\s*credit\s*card'
-            ],
-            BankType.CAPITAL_ONE: [
-                r'capital\s*one',
-                r'capitalone\.com',
-                r'venture\s*card',
-                r'quicksilver',
-                r'savor\s*card',
-                r'capital\s*one\s*bank'
-            ],
-            BankType.WELLS_FARGO: [
-                r'wells\s*fargo',
-                r'wellsfargo\.com',
-                r'propel\s*card',
-                r'wells\s*fargo\s*bank',
-                r'cash\s*wise'
-            ],
-            BankType.DISCOVER: [
-                r'discover\s*card',
-                r'discover\s*bank',
-                r'discover\.com',
-                r'cashback\s*bonus',
-                r'discover\s*it'
-            ],
-            BankType.BANCO_NACION: [
-                r'banco\s*naci[oó]n',
-                r'naci[oó]n\s*bank',
-                r'mastercard\s*gold',
-                r'nacion\s*mastercard',
-                r'banco\s*de\s*la\s*naci[oó]n',
-                r'bna\s*mastercard',
-                r'compras\s*del\s*mes',
-                r'resumen\s*de\s*cuenta'
-            ]
-        }
-
-        # Compile patterns for better performance
-        self.compiled_patterns = {}
-        for bank_type, patterns in self.bank_patterns.items():
-            self.compiled_patterns[bank_type] = [
-                re.compile(pattern, re.IGNORECASE | re.MULTILINE)
-                for pattern in patterns
-            ]
-
-        # Secondary indicators for ambiguous cases
-        self.secondary_indicators = {
-            BankType.CHASE: [
-                r'ultimate\s*rewards',
-                r'pay\s*chase',
-                r'chase\s*online',
-                r'fraud\s*prevention\s*center'
-            ],
-            BankType.AMEX: [
-                r'pay\s*over\s*time',
-                r'platinum\s*card',
-                r'gold\s*card',
-                r'green\s*card'
-            ],
-            BankType.CITIBANK: [
-                r'citi\s*online',
-                r'price\s*rewind',
-                r'citi\s*concierge'
-            ]
-        }
+        # Shared, precompiled module-level patterns
+        self.bank_patterns = _BANK_PATTERNS
+        self.compiled_patterns = _COMPILED_BANK
+        self.secondary_indicators = _SECONDARY_INDICATORS
 
     def detect_bank(self, text: str, confidence_threshold: float = 0.6) -> BankType:
         """
@@ -134,7 +222,36 @@ class BankDetector:
         # Clean text for better matching
         clean_text = self._clean_text_for_detection(text)
 
-        # Score each bank type
+        # Re-uploads of the same statement skip scoring entirely
+        cache_key = (text_digest(clean_text), confidence_threshold)
+        cached = _DETECTION_CACHE.get(cache_key)
+        if cached is not None:
+            logger.info(f"Bank detection cache hit: {cached}")
+            return cached
+
+        detected = self._select_bank(clean_text, confidence_threshold)
+        _DETECTION_CACHE.put(cache_key, detected)
+        return detected
+
+    def _select_bank(self, clean_text: str, confidence_threshold: float) -> BankType:
+        """
+        Score cleaned text against all banks and pick the best match.
+
+        Args:
+            clean_text: Text already passed through _clean_text_for_detection
+            confidence_threshold: Minimum confidence required for detection
+
+        Returns:
+            Detected bank type or GENERIC if uncertain
+        """
+        # Cheap literal scan first; most non-bank text stops here. Non-ASCII
+        # text skips it, since case-insensitive regexes also match letters
+        # such as 'ſ' that lower() leaves alone.
+        if clean_text.isascii() and not _KEYWORD_PREFILTER.search(clean_text.lower()):
+            logger.info("No bank patterns matched, using generic parser")
+            return BankType.GENERIC
+
+        # Score every bank (in table order, so ties resolve as before)
         bank_scores = {}
         for bank_type, patterns in self.compiled_patterns.items():
             score = self._calculate_bank_score(clean_text, patterns, bank_type)
@@ -162,10 +279,9 @@ class BankDetector:
     def _clean_text_for_detection(self, text: str) -> str:
         """Clean text for better pattern matching"""
         # Remove extra whitespace and normalize
-        clean_text = re.sub(r'\s+', ' ', text.strip())
+        clean_text = _WHITESPACE_RE.sub(' ', text.strip())
         # Remove special characters that might interfere
-        clean_text = re.sub(r'[^\w\s\.\-@]', ' ', clean_text)
-        return clean_text
+        return clean_text.translate(_DETECTION_CHAR_TABLE)
 
     def _calculate_bank_score(self, text: str, patterns: List[re.Pattern], bank_type: BankType) -> float:
         """
@@ -183,25 +299,23 @@ class BankDetector:
         pattern_matches = 0
 
         # Primary pattern matching
-        for pattern in patterns:
-            matches = len(pattern.findall(text))
-            if matches > 0:
-                pattern_matches += 1
-                # Weight multiple matches higher but with diminishing returns
-                base_score += min(matches * 0.3, 1.0)
+        primary_any = _PRIMARY_ANY.get(bank_type)
+        if primary_any is None or primary_any.search(text):
+            for pattern in patterns:
+                matches = _count_matches(pattern, text, _SCORE_SATURATION_MATCHES)
+                if matches > 0:
+                    pattern_matches += 1
+                    # Weight multiple matches higher but with diminishing returns
+                    base_score += min(matches * 0.3, 1.0)
 
         # Boost score if multiple different patterns match
         if pattern_matches > 1:
             base_score *= (1.0 + (pattern_matches - 1) * 0.2)
 
         # Check secondary indicators for additional confidence
-        if bank_type in self.secondary_indicators:
-            secondary_patterns = [
-                re.compile(pattern, re.IGNORECASE)
-                for pattern in self.secondary_indicators[bank_type]
-            ]
-
-            for pattern in secondary_patterns:
+        secondary_any = _SECONDARY_ANY.get(bank_type)
+        if secondary_any is not None and secondary_any.search(text):
+            for pattern in _COMPILED_SECONDARY[bank_type]:
                 if pattern.search(text):
                     base_score += 0.1  # Small boost for secondary indicators
 
@@ -225,7 +339,7 @@ class BankDetector:
             total_matches = 0
 
             for i, pattern in enumerate(patterns):
-                matches = len(pattern.findall(clean_text))
+                matches = _count_matches(pattern, clean_text)
                 if matches > 0:
                     matched_patterns.append({
                         'pattern_index': i,
@@ -257,4 +371,8 @@ class BankDetector:
             True if detection matches expectation
         """
         detected_bank = self.detect_bank(text)
-        return detected_bank == expected_bank
\ No newline at end of file
+        return detected_bank == expected_bank
+
+
+# Shared detector; its patterns are module-level so there is no per-instance state
+BANK_DETECTOR: BankDetector = BankDetector()
@@ -1,38 +1,66 @@
 """
 Bank parsers package for credit card statement processing.
+
+Concrete parsers are imported on first use (PEP 562), so importing the
+package only loads the base parser.
 """
-from typing import Optional
+import importlib
+from functools import lru_cache
+from typing import Optional, Union
 
 try:
     from ...models import BankType
 except ImportError:
     from models.statement_data import BankType
 from .base_parser import BaseStatementParser
-from .chase_parser import ChaseParser
-from .amex_parser import AmexParser
-from .generic_parser import GenericParser
-from .banco_nacion_parser import BancoNacionParser
-
-
-# Parser registry
-PARSER_REGISTRY = {
-    BankType.CHASE: ChaseParser,
-    BankType.AMEX: AmexParser,
-    BankType.BANCO_NACION: BancoNacionParser,
-    BankType.GENERIC: GenericParser,
+from .batch import parse_many
+
+
+# Built-in parser classes and the submodules that define them
+_PARSER_MODULES = {
+    "ChaseParser": ".chase_parser",
+    "AmexParser": ".amex_parser",
+    "GenericParser": ".generic_parser",
+    "BancoNacionParser": ".banco_nacion_parser",
+}
+
+# Parser registry; built-in parsers are referenced by class name until first use
+PARSER_REGISTRY: dict[BankType, Union[str, type]] = {
+    BankType.CHASE: "ChaseParser",
+    BankType.AMEX: "AmexParser",
+    BankType.BANCO_NACION: "BancoNacionParser",
+    BankType.GENERIC: "GenericParser",
     # Add more parsers as they are implemented
-    BankType.CITIBANK: GenericParser,  # Use generic parser for now
-    BankType.BANK_OF_AMERICA: GenericParser,
-    BankType.CAPITAL_ONE: GenericParser,
-    BankType.WELLS_FARGO: GenericParser,
-    BankType.DISCOVER: GenericParser,
+    BankType.CITIBANK: "GenericParser",  # Use generic parser for now
+    BankType.BANK_OF_AMERICA: "GenericParser",
+    BankType.CAPITAL_ONE: "GenericParser",
+    BankType.WELLS_FARGO: "GenericParser",
+    BankType.DISCOVER: "GenericParser",
 }
 
 
+def _load_parser_class(name: str) -> type:
+    """Import a built-in parser class and cache it as a module attribute"""
+    module = importlib.import_module(_PARSER_MODULES[name], __name__)
+    parser_class = getattr(module, name)
+    globals()[name] = parser_class
+    return parser_class
+
+
+def __getattr__(name: str):
+    if name in _PARSER_MODULES:
+        return _load_parser_class(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=None)
 def get_parser_for_bank(bank_type: BankType) -> Optional[BaseStatementParser]:
     """
     Get the appropriate parser for a bank type.
 
+    Parsers hold only compiled patterns and configuration, so one
+    instance per bank type is shared across requests.
+
     Args:
         bank_type: The detected bank type
 
@@ -40,11 +68,19 @@ def get_parser_for_bank(bank_type: BankType) -> Optional[BaseStatementParser]:
         Parser instance or None if not supported
     """
     parser_class = PARSER_REGISTRY.get(bank_type)
+    if isinstance(parser_class, str):
+        parser_class = _load_parser_class(parser_class)
     if parser_class:
-        return parser_class()
+        return _get_shared_parser(parser_class)
 
     # Fallback to generic parser
-    return GenericParser()
+    return _get_shared_parser(_load_parser_class("GenericParser"))
+
+
+@lru_cache(maxsize=None)
+def _get_shared_parser(parser_class: type) -> BaseStatementParser:
+    """Build one parser per class, so bank types mapped to the same class share it"""
+    return parser_class()
 
 
 def get_supported_banks() -> list[BankType]:
@@ -69,6 +105,9 @@ def register_parser(bank_type: BankType, parser_class: type) -> None:
         raise ValueError("Parser class must extend BaseStatementParser")
 
     PARSER_REGISTRY[bank_type] = parser_class
+    # Drop shared instances so the new parser is picked up
+    get_parser_for_bank.cache_clear()
+    _get_shared_parser.cache_clear()
 
 
 __all__ = [
@@ -79,5 +118,6 @@ __all__ = [
     "BancoNacionParser",
     "get_parser_for_bank",
     "get_supported_banks",
-    "register_parser"
+    "register_parser",
+    "parse_many"
 ]
\ No newline at end of file
@@ -3,16 +3,41 @@ American Express credit card statement parser.
 """
 import re
 from datetime import date
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 try:
-    from .base_parser import BaseStatementParser
+    from .base_parser import BaseStatementParser, _MONTHS_EN
+    from ...utils.keyword_matcher import KeywordMatcher
     from ...models import ProcessedStatement, StatementMetadata, BankType, Transaction, TransactionType
 except ImportError:
-    from services.bank_parsers.base_parser import BaseStatementParser
+    from services.bank_parsers.base_parser import BaseStatementParser, _MONTHS_EN
+    from utils.keyword_matcher import KeywordMatcher
     from models.statement_data import ProcessedStatement, StatementMetadata, BankType, Transaction, TransactionType
 
 
+# A dated Amex line starts with a month name or a digit, and "M/D x $1" is
+# the shortest line the transaction pattern can match
+_AMEX_MONTH_INITIALS = frozenset('JFMASONDjfmasond')
+_AMEX_MIN_LINE_LENGTH = 8
+
+# Amex transaction types by description keyword, in priority order
+_AMEX_TYPE_KEYWORDS = (
+    (TransactionType.PAYMENT, ('PAYMENT', 'AUTOPAY', 'THANK YOU', 'ONLINE PMT')),
+    (TransactionType.FEE, ('ANNUAL FEE', 'LATE FEE', 'RETURN FEE')),
+    (TransactionType.INTEREST, ('INTEREST', 'FINANCE CHARGE', 'PLAN FEES')),
+    (TransactionType.CASH_ADVANCE, ('CASH ADVANCE', 'ATM')),
+    (TransactionType.CREDIT, ('CREDIT', 'REFUND', 'ADJUSTMENT')),
+)
+# Payment keywords usually open the description and outrank every other type
+_AMEX_PAYMENT_PREFIXES = _AMEX_TYPE_KEYWORDS[0][1]
+_AMEX_TYPE_PRIORITY = tuple(transaction_type for transaction_type, _ in _AMEX_TYPE_KEYWORDS)
+_AMEX_TYPE_MATCHER = KeywordMatcher(
+    (keyword, transaction_type)
+    for transaction_type, keywords in _AMEX_TYPE_KEYWORDS
+    for keyword in keywords
+)
+
+
 class AmexParser(BaseStatementParser):
     """Parser for American Express credit card statements"""
 
@@ -40,18 +65,55 @@ class AmexParser(BaseStatementParser):
             re.IGNORECASE
         )
 
-        # Amex transaction patterns
-        self.transaction_patterns = [
-            # Format: MMM DD Description Amount
-            re.compile(r'^([A-Za-z]{3}\s+\d{1,2})\s+(.+?)\s+\$?([0-9,]+\.?\d{0,2})$'),
-            # Format: MM/DD Description $Amount
-            re.compile(r'^(\d{1,2}/\d{1,2})\s+(.+?)\s+\$([0-9,]+\.?\d{0,2})$'),
-            # Format with reference number: MMM DD Description REF Amount
-            re.compile(r'^([A-Za-z]{3}\s+\d{1,2})\s+(.+?)\s+([A-Z0-9]+)\s+\$?([0-9,]+\.?\d{0,2})$'),
-        ]
-
-    def parse_statement(self, text: str, filename: str = None) -> ProcessedStatement:
-        """Parse American Express credit card statement"""
+        # Amex transaction line, either "MMM DD Description Amount" or
+        # "MM/DD Description $Amount" (the dollar sign is required there)
+        self.transaction_pattern = re.compile(
+            r'^(?:(?P<mmm>[A-Za-z]{3}\s+\d{1,2})|(?P<mdy>\d{1,2}/\d{1,2}))'
+            r'\s+(?P<desc>.+?)\s+(?(mdy)\$|\$?)(?P<amt>[0-9,]+\.?\d{0,2})$'
+        )
+
+        self.year_pattern = re.compile(r'20\d{2}')
+
+        # Fallbacks when the statement date line is missing
+        self.period_patterns = (
+            re.compile(r'Statement\s+Period:?\s*([^\n]+)', re.IGNORECASE),
+            re.compile(r'Billing\s+Period:?\s*([^\n]+)', re.IGNORECASE),
+            re.compile(r'Statement\s+Closing\s+Date:?\s*([^\n]+)', re.IGNORECASE),
+        )
+
+        self.balance_patterns = (
+            self.balance_pattern,
+            re.compile(r'Total\s+Balance:?\s*\$?([0-9,]+\.?\d{0,2})', re.IGNORECASE),
+            re.compile(r'Current\s+Balance:?\s*\$?([0-9,]+\.?\d{0,2})', re.IGNORECASE),
+        )
+
+        self.alt_account_pattern = re.compile(r'Account\s+Number:?\s*[*\-x]*(\d{4,5})', re.IGNORECASE)
+
+        # Amex header and summary lines that never hold transactions
+        self.amex_ignore_pattern = re.compile(
+            '|'.join(f'(?:{pattern})' for pattern in (
+                r'^AMERICAN EXPRESS',
+                r'^Member\s+Since',
+                r'^Account\s+Summary',
+                r'^Previous\s+Balance',
+                r'^Payments\s+and\s+Credits',
+                r'^Purchases\s+and\s+Adjustments',
+                r'^Fees',
+                r'^Interest\s+and\s+Finance\s+Charges',
+                r'^Page\s+\d+',
+                r'^Statement\s+Date',
+                r'^Payment\s+Due\s+Date',
+                r'^Membership\s+Rewards',
+            )),
+            re.IGNORECASE
+        )
+
+    def parse_statement(self, text: str, filename: str = None, keep_raw_text: bool = False) -> ProcessedStatement:
+        """
+        Parse American Express credit card statement.
+
+        The statement only holds on to text when keep_raw_text is set.
+        """
         metadata = self.extract_metadata(text)
         transactions = self.extract_transactions(text)
 
@@ -62,7 +124,7 @@ class AmexParser(BaseStatementParser):
         return ProcessedStatement(
             transactions=transactions,
             metadata=metadata,
-            raw_text=text,
+            raw_text=text if keep_raw_text else None,
             processing_notes=notes
         )
 
@@ -84,78 +146,67 @@ class AmexParser(BaseStatementParser):
 
     def extract_transactions(self, text: str) -> List[Transaction]:
         """Extract transactions with Amex-specific logic"""
-        transactions = []
-        lines = text.split('\n')
-        current_year = None
-
-        # Try to determine the statement year
-        for line in lines:
-            year_match = re.search(r'20\d{2}', line)
-            if year_match:
-                current_year = int(year_match.group())
-                break
-
-        if not current_year:
-            current_year = 2024
-
-        for line_num, line in enumerate(lines):
-            line = line.strip()
-            if not line or self._should_ignore_line(line):
+        return list(self.iter_transactions(text))
+
+    def iter_transactions(self, text: str) -> Iterator[Transaction]:
+        """Yield Amex transactions in statement order"""
+        # Use the first year in the statement; a year never spans lines, so
+        # one search over the text finds the same match as a line-by-line scan
+        year_match = self.year_pattern.search(text)
+        current_year = int(year_match.group()) if year_match else 2024
+
+        # Bound once; this loop runs for every line of the statement
+        should_ignore_line = self._should_ignore_line
+        parse_transaction = self._parse_amex_transaction
+
+        for line_num, line in enumerate(self._iter_lines(text)):
+            if should_ignore_line(line):
                 continue
 
-            transaction = self._parse_amex_transaction(line, current_year, line_num)
+            transaction = parse_transaction(line, current_year, line_num)
             if transaction:
-                transactions.append(transaction)
-
-        return transactions
+                yield transaction
 
     def _parse_amex_transaction(self, line: str, year: int, line_num: int) -> Optional[Transaction]:
         """Parse an Amex-specific transaction line"""
-        for pattern in self.transaction_patterns:
-            match = pattern.match(line)
-            if match:
-                try:
-                    groups = match.groups()
-                    date_str = groups[0]
-                    description = groups[1].strip()
-
-                    # Handle patterns with reference numbers
-                    if len(groups) == 4:  # Has reference number
-                        reference = groups[2]
-                        amount_str = groups[3]
-                    else:
-                        reference = None
-                        amount_str = groups[2]
-
-                    # Parse date
-                    transaction_date = self._parse_amex_date(date_str, year)
-                    if not transaction_date:
-                        continue
+        # Lines that cannot hold an Amex date go straight to the base parser
+        if len(line) < _AMEX_MIN_LINE_LENGTH or not (line[0].isdigit() or line[0] in _AMEX_MONTH_INITIALS):
+            return super()._parse_transaction_line(line, line_num)
 
+        match = self.transaction_pattern.match(line)
+        if match:
+            try:
+                date_str = match.group('mmm') or match.group('mdy')
+                description = match.group('desc').strip()
+                amount_str = match.group('amt')
+
+                # Parse date
+                transaction_date = self._parse_amex_date(date_str, year)
+                if transaction_date:
                     # Parse amount
                     amount = float(amount_str.replace(',', ''))
 
                     # Determine if it's a credit
-                    is_credit = (description.upper().startswith('PAYMENT') or
-                               'CREDIT' in description.upper() or
+                    desc_upper = description.upper()
+                    is_credit = (desc_upper.startswith('PAYMENT') or
+                               'CREDIT' in desc_upper or
                                amount < 0)
 
                     if is_credit:
                         amount = -abs(amount)
 
                     # Classify transaction type
-                    transaction_type = self._classify_amex_transaction(description)
+                    transaction_type = self._classify_amex_transaction(description, desc_upper)
 
                     return Transaction(
                         date=transaction_date,
                         description=description,
                         amount=amount,
-                        transaction_type=transaction_type,
-                        reference=reference
+                        transaction_type=transaction_type
                     )
 
-                except (ValueError, IndexError):
-                    continue
+            except (ValueError, IndexError):
+                pass
 
         # Fallback to base parser logic
         return super()._parse_transaction_line(line, line_num)
@@ -165,46 +216,29 @@ class AmexParser(BaseStatementParser):
         try:
             if '/' in date_str:
                 # MM/DD format
-                parts = date_str.split('/')
-                if len(parts) == 2:
-                    month, day = int(parts[0]), int(parts[1])
-                    return date(year, month, day)
+                month_str, _, day_str = date_str.partition('/')
+                return date(year, int(month_str), int(day_str))
             else:
-                # MMM DD format
-                month_names = {
-                    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4,
-                    'may': 5, 'jun': 6, 'jul': 7, 'aug': 8,
-                    'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
-                }
-
-                parts = date_str.split()
-                if len(parts) == 2:
-                    month_str, day_str = parts
-                    month = month_names.get(month_str.lower()[:3])
-                    if month:
-                        day = int(day_str)
-                        return date(year, month, day)
+                # MMM DD format; the month name is always three letters and
+                # int() skips the whitespace before the day
+                month = _MONTHS_EN.get(date_str[:3].lower())
+                if month:
+                    return date(year, month, int(date_str[3:]))
         except (ValueError, IndexError):
             pass
         return None
 
-    def _classify_amex_transaction(self, description: str) -> TransactionType:
-        """Classify Amex transaction types"""
-        desc_upper = description.upper()
+    def _classify_amex_transaction(self, description: str, desc_upper: Optional[str] = None) -> TransactionType:
+        """Classify Amex transaction types; desc_upper may be passed if already computed"""
+        if desc_upper is None:
+            desc_upper = description.upper()
 
-        # Amex-specific patterns
-        if any(keyword in desc_upper for keyword in ['PAYMENT', 'AUTOPAY', 'THANK YOU', 'ONLINE PMT']):
+        # A payment prefix contains a payment keyword, so it settles the type without a scan
+        if desc_upper.startswith(_AMEX_PAYMENT_PREFIXES):
             return TransactionType.PAYMENT
-        elif any(keyword in desc_upper for keyword in ['ANNUAL FEE', 'LATE FEE', 'RETURN FEE']):
-            return TransactionType.FEE
-        elif any(keyword in desc_upper for keyword in ['INTEREST', 'FINANCE CHARGE', 'PLAN FEES']):
-            return TransactionType.INTEREST
-        elif any(keyword in desc_upper for keyword in ['CASH ADVANCE', 'ATM']):
-            return TransactionType.CASH_ADVANCE
-        elif any(keyword in desc_upper for keyword in ['CREDIT', 'REFUND', 'ADJUSTMENT']):
-            return TransactionType.CREDIT
-        else:
-            return TransactionType.PURCHASE
+
+        transaction_type = _AMEX_TYPE_MATCHER.first_value(desc_upper, _AMEX_TYPE_PRIORITY)
+        return transaction_type or TransactionType.PURCHASE
 
     def _extract_statement_period(self, text: str) -> Optional[str]:
         """Extract statement period from Amex text"""
@@ -213,14 +247,8 @@ class AmexParser(BaseStatementParser):
             return f"Statement Date: {match.group(1)}"
 
         # Alternative patterns
-        period_patterns = [
-            r'Statement\s+Period:?\s*([^\n]+)',
-            r'Billing\s+Period:?\s*([^\n]+)',
-            r'Statement\s+Closing\s+Date:?\s*([^\n]+)',
-        ]
-
-        for pattern in period_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in self.period_patterns:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
 
@@ -235,13 +263,7 @@ class AmexParser(BaseStatementParser):
 
     def _extract_balance(self, text: str) -> Optional[str]:
         """Extract account balance"""
-        balance_patterns = [
-            self.balance_pattern,
-            re.compile(r'Total\s+Balance:?\s*\$?([0-9,]+\.?\d{0,2})', re.IGNORECASE),
-            re.compile(r'Current\s+Balance:?\s*\$?([0-9,]+\.?\d{0,2})', re.IGNORECASE),
-        ]
-
-        for pattern in balance_patterns:
+        for pattern in self.balance_patterns:
             match = pattern.search(text)
             if match:
                 return f"${match.group(1)}"
@@ -254,31 +276,14 @@ class AmexParser(BaseStatementParser):
             return f"*****{match.group(1)}"
 
         # Alternative pattern
-        alt_pattern = re.compile(r'Account\s+Number:?\s*[*\-x]*(\d{4,5})', re.IGNORECASE)
-        match = alt_pattern.search(text)
+        match = self.alt_account_pattern.search(text)
         if match:
             return f"****{match.group(1)}"
         return None
 
     def _should_ignore_line(self, line: str) -> bool:
         """Amex-specific line filtering"""
-        amex_ignore_patterns = [
-            r'^AMERICAN EXPRESS',
-            r'^Member\s+Since',
-            r'^Account\s+Summary',
-            r'^Previous\s+Balance',
-            r'^Payments\s+and\s+Credits',
-            r'^Purchases\s+and\s+Adjustments',
-            r'^Fees',
-            r'^Interest\s+and\s+Finance\s+Charges',
-            r'^Page\s+\d+',
-            r'^Statement\s+Date',
-            r'^Payment\s+Due\s+Date',
-            r'^Membership\s+Rewards',
-        ]
-
-        for pattern in amex_ignore_patterns:
-            if re.match(pattern, line, re.IGNORECASE):
-                return True
+        if self.amex_ignore_pattern.match(line):
+            return True
 
         return super()._should_ignore_line(line)
\ No newline at end of file
@@ -3,41 +3,66 @@ Banco Nación Mastercard Gold credit card statement parser.
 """
 import re
 from datetime import date, datetime
-from typing import List, Optional
+from typing import Iterator, List, Optional
 import logging
 
 try:
     from .base_parser import BaseStatementParser
+    from ...utils.keyword_matcher import KeywordMatcher
     from ...models import ProcessedStatement, StatementMetadata, BankType, Transaction, TransactionType
 except ImportError:
     from services.bank_parsers.base_parser import BaseStatementParser
+    from utils.keyword_matcher import KeywordMatcher
     from models.statement_data import ProcessedStatement, StatementMetadata, BankType, Transaction, TransactionType
 
 logger = logging.getLogger(__name__)
 
 
+# Month name mapping for Spanish
+_MONTHS_ES = {
+    'ene': 1, 'feb': 2, 'mar': 3, 'abr': 4,
+    'may': 5, 'jun': 6, 'jul': 7, 'ago': 8,
+    'sep': 9, 'oct': 10, 'nov': 11, 'dic': 12,
+    # Alternative forms
+    'enero': 1, 'febrero': 2, 'marzo': 3, 'abril': 4,
+    'mayo': 5, 'junio': 6, 'julio': 7, 'agosto': 8,
+    'septiembre': 9, 'setiembre': 9, 'octubre': 10, 'noviembre': 11, 'diciembre': 12
+}
+
+# Banco Nación transaction types by description keyword, in priority order
+_BANCO_NACION_TYPE_KEYWORDS = (
+    (TransactionType.PAYMENT, ('PAGO', 'PAYMENT', 'ACREDITACION', 'CREDIT')),
+    (TransactionType.INTEREST, ('INTERES', 'INTEREST', 'FINANCIACION')),
+    (TransactionType.FEE, ('COMISION', 'FEE', 'CARGO', 'ANUAL')),
+    (TransactionType.CASH_ADVANCE, ('ADELANTO', 'CASH', 'ATM', 'CAJERO')),
+    (TransactionType.CREDIT, ('DEVOLUCION', 'REFUND', 'NOTA CREDITO')),
+)
+_BANCO_NACION_TYPE_PRIORITY = tuple(transaction_type for transaction_type, _ in _BANCO_NACION_TYPE_KEYWORDS)
+_BANCO_NACION_TYPE_MATCHER = KeywordMatcher(
+    (keyword, transaction_type)
+    for transaction_type, keywords in _BANCO_NACION_TYPE_KEYWORDS
+    for keyword in keywords
+)
+
+
 class BancoNacionParser(BaseStatementParser):
     """Parser for Banco Nación Mastercard Gold credit card statements"""
 
     def __init__(self):
         super().__init__(BankType.BANCO_NACION)
 
-        # Banco Nación specific patterns
+        # Banco Nación specific patterns. Whitespace never spans a newline and
+        # the line may be padded, so a whole section can be scanned at once.
+        # Kept on stdlib re rather than compile_linear: the pattern has no
+        # nested quantifiers, and the RE2 wrapper's per-match cost makes a
+        # match-dense section scan several times slower.
         self.transaction_pattern = re.compile(
-            r'(\d{2}-[a-zA-Z]{3}\.?-\d{2})\s+(.+?)\s+(\d{5})\s+([\d.]+,\d{2})$',
-            re.IGNORECASE
+            r'^[^\S\n]*(\d{2}-[a-zA-Z]{3}\.?-\d{2})[^\S\n]+(.+?)[^\S\n]+(\d{5})[^\S\n]+([\d.]+,\d{2})[^\S\n]*$',
+            re.IGNORECASE | re.MULTILINE
         )
 
         # Month name mapping for Spanish
-        self.month_names = {
-            'ene': 1, 'feb': 2, 'mar': 3, 'abr': 4,
-            'may': 5, 'jun': 6, 'jul': 7, 'ago': 8,
-            'sep': 9, 'oct': 10, 'nov': 11, 'dic': 12,
-            # Alternative forms
-            'enero': 1, 'febrero': 2, 'marzo': 3, 'abril': 4,
-            'mayo': 5, 'junio': 6, 'julio': 7, 'agosto': 8,
-            'septiembre': 9, 'setiembre': 9, 'octubre': 10, 'noviembre': 11, 'diciembre': 12
-        }
+        self.month_names = _MONTHS_ES
 
         # Statement metadata patterns
         self.cardholder_pattern = re.compile(r'Titular:?\s*(.+?)(?:\n|Tarjeta)', re.IGNORECASE)
@@ -49,10 +74,42 @@ class BancoNacionParser(BaseStatementParser):
 
         # Section indicators
         self.transaction_section_start = re.compile(r'COMPRAS\s+DEL\s+MES', re.IGNORECASE)
-        self.transaction_section_end = re.compile(r'(?:TOTAL\s+COMPRAS|RESUMEN\s+DE\s+CUENTA|DETALLE\s+DE\s+PAGOS)', re.IGNORECASE)
+        # Either marker, confined to a single line
+        self.section_boundary_pattern = re.compile(
+            r'COMPRAS[^\S\n]+DEL[^\S\n]+MES|TOTAL[^\S\n]+COMPRAS|RESUMEN[^\S\n]+DE[^\S\n]+CUENTA|DETALLE[^\S\n]+DE[^\S\n]+PAGOS',
+            re.IGNORECASE
+        )
 
-    def parse_statement(self, text: str, filename: str = None) -> ProcessedStatement:
-        """Parse Banco Nación credit card statement"""
+        self.year_pattern = re.compile(r'20\d{2}')
+
+        # Spanish header and summary lines that never hold transactions
+        self.ignore_pattern = re.compile(
+            '|'.join(f'(?:{pattern})' for pattern in (
+                r'^Page\s+\d+',
+                r'^P[aá]gina\s+\d+',
+                r'^Resumen\s+de\s+Cuenta',
+                r'^Titular:',
+                r'^Tarjeta:',
+                r'^Per[ií]odo:',
+                r'^Vencimiento:',
+                r'^Saldo:',
+                r'^Pago\s+M[ií]nimo:',
+                r'^COMPRAS\s+DEL\s+MES\s*$',
+                r'^TOTAL\s+COMPRAS',
+                r'^DETALLE\s+DE\s+PAGOS',
+                r'^\s*$',
+                r'^-+\s*$',
+                r'^=+\s*$',
+            )),
+            re.IGNORECASE
+        )
+
+    def parse_statement(self, text: str, filename: str = None, keep_raw_text: bool = False) -> ProcessedStatement:
+        """
+        Parse Banco Nación credit card statement.
+
+        The statement only holds on to text when keep_raw_text is set.
+        """
         metadata = self.extract_metadata(text)
         transactions = self.extract_transactions(text)
 
@@ -63,7 +120,7 @@ class BancoNacionParser(BaseStatementParser):
         return ProcessedStatement(
             transactions=transactions,
             metadata=metadata,
-            raw_text=text,
+            raw_text=text if keep_raw_text else None,
             processing_notes=notes
         )
 
@@ -89,45 +146,60 @@ class BancoNacionParser(BaseStatementParser):
 
     def extract_transactions(self, text: str) -> List[Transaction]:
         """Extract transactions from Banco Nación statement"""
-        transactions = []
-        lines = text.split('\n')
+        transactions = list(self.iter_transactions(text))
+        logger.info(f"Extracted {len(transactions)} transactions from Banco Nación statement")
+        return transactions
 
-        # Find transaction section
-        in_transaction_section = False
+    def iter_transactions(self, text: str) -> Iterator[Transaction]:
+        """
+        Yield Banco Nación transactions in statement order.
+
+        Only the marker lines are located in Python; each stretch of text
+        between a section start and the next boundary is scanned for
+        transaction lines in a single finditer call.
+        """
         current_year = self._detect_year(text)
 
-        for line_num, line in enumerate(lines):
-            line = line.strip()
-            if not line:
-                continue
+        # Find transaction sections
+        in_transaction_section = False
+        section_start = 0
+        find_boundary = self.section_boundary_pattern.search
+        is_section_start = self.transaction_section_start.search
+        boundary = find_boundary(text)
+
+        while boundary:
+            line_start = text.rfind('\n', 0, boundary.start()) + 1
+            line_end = text.find('\n', boundary.end())
+            if line_end == -1:
+                line_end = len(text)
+
+            if in_transaction_section:
+                yield from self._iter_section_transactions(text, section_start, line_start, current_year)
 
-            # Check for section start
-            if self.transaction_section_start.search(line):
+            # A line holding both markers opens a section
+            if is_section_start(text, line_start, line_end):
                 in_transaction_section = True
                 logger.info("Found transaction section start")
-                continue
-
-            # Check for section end
-            if self.transaction_section_end.search(line):
+            else:
                 in_transaction_section = False
                 logger.info("Found transaction section end")
-                continue
 
-            # Parse transaction if we're in the right section
-            if in_transaction_section:
-                transaction = self._parse_banco_nacion_transaction(line, current_year)
-                if transaction:
-                    transactions.append(transaction)
+            section_start = line_end
+            boundary = find_boundary(text, line_end)
 
-        logger.info(f"Extracted {len(transactions)} transactions from Banco Nación statement")
-        return transactions
+        if in_transaction_section:
+            yield from self._iter_section_transactions(text, section_start, len(text), current_year)
 
-    def _parse_banco_nacion_transaction(self, line: str, year: int) -> Optional[Transaction]:
-        """Parse a single Banco Nación transaction line"""
-        match = self.transaction_pattern.match(line)
-        if not match:
-            return None
+    def _iter_section_transactions(self, text: str, start: int, end: int, year: int) -> Iterator[Transaction]:
+        """Yield every transaction line found in text[start:end]"""
+        build_transaction = self._build_transaction_from_match
+        for match in self.transaction_pattern.finditer(text, start, end):
+            transaction = build_transaction(match, year)
+            if transaction:
+                yield transaction
 
+    def _build_transaction_from_match(self, match: re.Match, year: int) -> Optional[Transaction]:
+        """Build a transaction from a transaction_pattern match"""
         try:
             date_str, description, reference, amount_str = match.groups()
 
@@ -166,31 +238,24 @@ class BancoNacionParser(BaseStatementParser):
             )
 
         except (ValueError, IndexError) as e:
-            logger.warning(f"Error parsing transaction line '{line}': {str(e)}")
+            logger.warning(f"Error parsing transaction line '{match.group(0).strip()}': {str(e)}")
             return None
 
     def _parse_banco_nacion_date(self, date_str: str, current_year: int) -> Optional[date]:
-        """Parse Banco Nación date format (dd-mmm-yy)"""
+        """Parse Banco Nación date format (dd-mmm-yy or dd-mmm.-yy)"""
         try:
-            # Split date parts using only hyphens, not dots
-            parts = date_str.split('-')
-            if len(parts) != 3:
+            # Fixed-width fields, as captured by transaction_pattern
+            if date_str[2:3] != '-' or date_str[-3:-2] != '-':
                 return None
+            day = int(date_str[:2])
 
-            day_str, month_str, year_str = parts
-            day = int(day_str)
-
-            # Remove trailing dot from month if present
-            month_str = month_str.rstrip('.')
-
-            # Map Spanish month names
-            month_str = month_str.lower()
-            month = self.month_names.get(month_str)
+            # Map Spanish month names, dropping the abbreviation dot if present
+            month = _MONTHS_ES.get(date_str[3:-3].rstrip('.').lower())
             if not month:
                 return None
 
             # Handle 2-digit year
-            year = int(year_str)
+            year = int(date_str[-2:])
             if year < 100:
                 # Determine century based on current year
                 if year <= 50:  # Assume years 00-50 are 20xx
@@ -209,13 +274,10 @@ class BancoNacionParser(BaseStatementParser):
             # Remove spaces and handle Argentinian number format
             amount_str = amount_str.strip()
 
-            # Convert from Argentinian format (123.456,78) to US format (123456.78)
-            # First, replace comma with temp placeholder
-            amount_str = amount_str.replace(',', '|DECIMAL|')
-            # Remove dots (thousands separators)
-            amount_str = amount_str.replace('.', '')
-            # Replace temp placeholder with decimal point
-            amount_str = amount_str.replace('|DECIMAL|', '.')
+            # Convert from Argentinian format (123.456,78) to US format (123456.78).
+            # str.replace runs a memchr-backed loop in C, while translate with a
+            # deleting table walks the string through a per-character dict lookup.
+            amount_str = amount_str.replace('.', '').replace(',', '.')
 
             return float(amount_str)
 
@@ -226,19 +288,8 @@ class BancoNacionParser(BaseStatementParser):
         """Classify Banco Nación transaction type"""
         desc_upper = description.upper()
 
-        # Check for specific patterns
-        if any(keyword in desc_upper for keyword in ['PAGO', 'PAYMENT', 'ACREDITACION', 'CREDIT']):
-            return TransactionType.PAYMENT
-        elif any(keyword in desc_upper for keyword in ['INTERES', 'INTEREST', 'FINANCIACION']):
-            return TransactionType.INTEREST
-        elif any(keyword in desc_upper for keyword in ['COMISION', 'FEE', 'CARGO', 'ANUAL']):
-            return TransactionType.FEE
-        elif any(keyword in desc_upper for keyword in ['ADELANTO', 'CASH', 'ATM', 'CAJERO']):
-            return TransactionType.CASH_ADVANCE
-        elif any(keyword in desc_upper for keyword in ['DEVOLUCION', 'REFUND', 'NOTA CREDITO']):
-            return TransactionType.CREDIT
-        else:
-            return TransactionType.PURCHASE
+        transaction_type = _BANCO_NACION_TYPE_MATCHER.first_value(desc_upper, _BANCO_NACION_TYPE_PRIORITY)
+        return transaction_type or TransactionType.PURCHASE
 
     def _extract_cardholder(self, text: str) -> Optional[str]:
         """Extract cardholder name"""
@@ -285,37 +336,18 @@ class BancoNacionParser(BaseStatementParser):
 
     def _detect_year(self, text: str) -> int:
         """Detect the statement year from text"""
-        # Look for 4-digit years
-        year_matches = re.findall(r'20\d{2}', text)
-        if year_matches:
-            # Return the most recent year found
-            return max(int(year) for year in year_matches)
+        # Return the most recent 4-digit year found. Every match starts with
+        # "20", so comparing the strings orders them like the numbers.
+        latest = max((match.group() for match in self.year_pattern.finditer(text)), default=None)
+        if latest:
+            return int(latest)
 
         # Fallback to current year
         return datetime.now().year
 
     def _should_ignore_line(self, line: str) -> bool:
         """Check if line should be ignored during parsing"""
-        ignore_patterns = [
-            r'^Page\s+\d+',
-            r'^P[aá]gina\s+\d+',
-            r'^Resumen\s+de\s+Cuenta',
-            r'^Titular:',
-            r'^Tarjeta:',
-            r'^Per[ií]odo:',
-            r'^Vencimiento:',
-            r'^Saldo:',
-            r'^Pago\s+M[ií]nimo:',
-            r'^COMPRAS\s+DEL\s+MES\s*$',
-            r'^TOTAL\s+COMPRAS',
-            r'^DETALLE\s+DE\s+PAGOS',
-            r'^\s*$',
-            r'^-+\s*$',
-            r'^=+\s*$',
-        ]
-
-        for pattern in ignore_patterns:
-            if re.match(pattern, line, re.IGNORECASE):
-                return True
+        if self.ignore_pattern.match(line):
+            return True
 
         return super()._should_ignore_line(line)
\ No newline at end of file
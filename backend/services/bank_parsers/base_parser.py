@@ -4,7 +4,9 @@ Base parser class for credit card statement processing.
 import re
 from abc import ABC, abstractmethod
 from datetime import datetime, date
-from typing import List, Optional, Dict, Tuple, Any
+from functools import lru_cache
+from operator import attrgetter
+from typing import Iterable, Iterator, List, Optional, Dict, Pattern, Tuple, Any
 import logging
 
 try:
@@ -16,6 +18,8 @@ try:
         BankType,
         ParsingConfig
     )
+    from ...utils.cache import LRUCache, text_digest
+    from ...utils.keyword_matcher import KeywordMatcher
 except ImportError:
     # Fallback for when running as script
     from models.statement_data import (
@@ -26,72 +30,193 @@ except ImportError:
         BankType,
         ParsingConfig
     )
+    from utils.cache import LRUCache, text_digest
+    from utils.keyword_matcher import KeywordMatcher
 
 logger = logging.getLogger(__name__)
 
+# Parsed statements by (parser class, filename, text digest); statements can
+# hold the whole raw text, so the cache stays small
+_STATEMENT_CACHE = LRUCache(maxsize=32)
+
+# English month abbreviations; shared with the subclasses that read month names
+_MONTHS_EN = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4,
+    'may': 5, 'jun': 6, 'jul': 7, 'aug': 8,
+    'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+
+# Field order of the groups captured by each date pattern
+_DATE_MDY, _DATE_YMD, _DATE_MONTH_NAME = range(3)
+
+# The regexes datetime.strptime uses for each numeric directive, so a
+# compiled numeric format accepts exactly the strings strptime would
+_STRPTIME_FIELDS = {
+    'd': r'(?P<d>3[01]|[12]\d|0[1-9]|[1-9]| [1-9])',
+    'm': r'(?P<m>1[0-2]|0[1-9]|[1-9])',
+    'Y': r'(?P<Y>\d\d\d\d)',
+    'y': r'(?P<y>\d\d)',
+}
+_NUMERIC_DATE_FORMAT = re.compile(r'%([dmYy])([/-])%([dmYy])\2%([dmYy])')
+
+
+@lru_cache(maxsize=None)
+def _compile_numeric_date_format(fmt: str) -> Optional[Pattern]:
+    """Compile a day/month/year format such as %m/%d/%Y; None for any other format"""
+    shape = _NUMERIC_DATE_FORMAT.fullmatch(fmt)
+    if not shape:
+        return None
+    fields = shape.group(1, 3, 4)
+    if set(fields) not in ({'d', 'm', 'Y'}, {'d', 'm', 'y'}):
+        return None
+    return re.compile(shape.group(2).join(_STRPTIME_FIELDS[field] for field in fields))
+
+# Transaction types by lower-case description keyword, in priority order;
+# a space in a keyword stands for any run of whitespace
+_BASE_TYPE_KEYWORDS = (
+    (TransactionType.PAYMENT, ('payment thank you', 'autopay', 'online payment', 'payment received')),
+    (TransactionType.FEE, ('fee', 'charge', 'annual fee', 'late fee', 'foreign transaction')),
+    (TransactionType.INTEREST, ('interest', 'finance charge', 'apr')),
+    (TransactionType.CASH_ADVANCE, ('cash advance', 'atm', 'cash withdrawal')),
+    (TransactionType.CREDIT, ('credit', 'refund', 'return')),
+)
+_BASE_TYPE_PRIORITY = tuple(transaction_type for transaction_type, _ in _BASE_TYPE_KEYWORDS)
+_BASE_TYPE_MATCHER = KeywordMatcher(
+    (keyword, transaction_type)
+    for transaction_type, keywords in _BASE_TYPE_KEYWORDS
+    for keyword in keywords
+)
+
 
 class BaseStatementParser(ABC):
     """Abstract base class for credit card statement parsers"""
 
+    # Patterns are compiled once at import and shared by every instance;
+    # subclasses read them through self like any other attribute.
+
+    # Common date patterns, tagged with the order of their fields and the
+    # separator a line must contain for the pattern to match at all
+    date_patterns = (
+        (re.compile(r'(\d{1,2})/(\d{1,2})/(\d{2,4})'), _DATE_MDY, '/'),  # MM/DD/YYYY or MM/DD/YY
+        (re.compile(r'(\d{1,2})-(\d{1,2})-(\d{2,4})'), _DATE_MDY, '-'),  # MM-DD-YYYY
+        (re.compile(r'(\d{2,4})-(\d{1,2})-(\d{1,2})'), _DATE_YMD, '-'),  # YYYY-MM-DD
+        (re.compile(r'([A-Za-z]{3})\s+(\d{1,2}),?\s+(\d{2,4})'), _DATE_MONTH_NAME, None),  # Jan 15, 2024
+    )
+
+    # Common amount patterns with optional currency symbols
+    amount_patterns = (
+        re.compile(r'\$?\s*([0-9,]+\.?\d{0,2})\s*(?:CR|DB)?', re.IGNORECASE),
+        re.compile(r'([0-9,]+\.?\d{0,2})\s*\$?', re.IGNORECASE),
+        re.compile(r'\$\s*([0-9,]+\.?\d{0,2})', re.IGNORECASE),
+    )
+
+    # Every supported date has digits, so a line without one is rejected
+    # with a single fast scan instead of the date patterns
+    date_hint_pattern = re.compile(r'\d')
+
+    # Credit/debit markers stripped from descriptions once dates and amounts
+    # are gone, applied in order: removing a CR can form a new DB. Each is
+    # keyed by the upper-cased letters it needs, which only c/r and d/b
+    # case-fold to, so a substring test can skip the regex pass
+    description_noise_patterns = (
+        ('CR', re.compile(r'\s*CR\s*', re.IGNORECASE)),
+        ('DB', re.compile(r'\s*DB\s*', re.IGNORECASE)),
+    )
+
+    # Transaction type patterns, kept for non-ASCII descriptions where
+    # re's case folding differs from str.lower()
+    transaction_type_patterns = {
+        transaction_type: [
+            re.compile(r'\s+'.join(map(re.escape, keyword.split())), re.IGNORECASE)
+            for keyword in keywords
+        ]
+        for transaction_type, keywords in _BASE_TYPE_KEYWORDS
+    }
+
+    # Header, summary and separator lines that never hold transactions.
+    # The anchored alternatives are fused into one pattern so each line
+    # costs a single regex call; the subclasses' ignore patterns are built
+    # the same way
+    common_ignore_pattern = re.compile(
+        '|'.join(f'(?:{pattern})' for pattern in (
+            r'^Page\s+\d+',
+            r'^Statement\s+Date',
+            r'^Account\s+Number',
+            r'^Total\s+',
+            r'^Balance\s+',
+            r'^Previous\s+Balance',
+            r'^New\s+Balance',
+            r'^\s*$',
+            r'^-+\s*$',
+            r'^=+\s*$',
+        )),
+        re.IGNORECASE
+    )
+
     def __init__(self, bank_type: BankType):
         self.bank_type = bank_type
         self.config = ParsingConfig(bank_type=bank_type)
 
-        # Common regex patterns
-        self.date_patterns = [
-            re.compile(r'(\d{1,2})/(\d{1,2})/(\d{2,4})'),  # MM/DD/YYYY or MM/DD/YY
-            re.compile(r'(\d{1,2})-(\d{1,2})-(\d{2,4})'),  # MM-DD-YYYY
-            re.compile(r'(\d{2,4})-(\d{1,2})-(\d{1,2})'),  # YYYY-MM-DD
-            re.compile(r'([A-Za-z]{3})\s+(\d{1,2}),?\s+(\d{2,4})'),  # Jan 15, 2024
-        ]
+    @classmethod
+    def parse_many(cls, texts: Iterable[str], max_workers: Optional[int] = None) -> List[ProcessedStatement]:
+        """
+        Parse many statement texts with this parser in worker processes.
 
-        # Common amount patterns with optional currency symbols
-        self.amount_patterns = [
-            re.compile(r'\$?\s*([0-9,]+\.?\d{0,2})\s*(?:CR|DB)?', re.IGNORECASE),
-            re.compile(r'([0-9,]+\.?\d{0,2})\s*\$?', re.IGNORECASE),
-            re.compile(r'\$\s*([0-9,]+\.?\d{0,2})', re.IGNORECASE),
-        ]
+        Args:
+            texts: Extracted statement texts
+            max_workers: Number of worker processes
+
+        Returns:
+            List of ProcessedStatement objects in the order of texts
+        """
+        # Imported here because the batch module imports this one
+        from .batch import parse_many
+        return parse_many(texts, cls, max_workers=max_workers)
+
+    def parse_statement_cached(self, text: str, filename: str = None,
+                               keep_raw_text: bool = False) -> ProcessedStatement:
+        """
+        Parse statement text, reusing the result of an earlier identical parse.
 
-        # Transaction type patterns
-        self.transaction_type_patterns = {
-            TransactionType.PAYMENT: [
-                re.compile(r'payment\s+thank\s+you', re.IGNORECASE),
-                re.compile(r'autopay', re.IGNORECASE),
-                re.compile(r'online\s+payment', re.IGNORECASE),
-                re.compile(r'payment\s+received', re.IGNORECASE),
-            ],
-            TransactionType.FEE: [
-                re.compile(r'fee', re.IGNORECASE),
-                re.compile(r'charge', re.IGNORECASE),
-                re.compile(r'annual\s+fee', re.IGNORECASE),
-                re.compile(r'late\s+fee', re.IGNORECASE),
-                re.compile(r'foreign\s+transaction', re.IGNORECASE),
-            ],
-            TransactionType.INTEREST: [
-                re.compile(r'interest', re.IGNORECASE),
-                re.compile(r'finance\s+charge', re.IGNORECASE),
-                re.compile(r'apr', re.IGNORECASE),
-            ],
-            TransactionType.CASH_ADVANCE: [
-                re.compile(r'cash\s+advance', re.IGNORECASE),
-                re.compile(r'atm', re.IGNORECASE),
-                re.compile(r'cash\s+withdrawal', re.IGNORECASE),
-            ],
-            TransactionType.CREDIT: [
-                re.compile(r'credit', re.IGNORECASE),
-                re.compile(r'refund', re.IGNORECASE),
-                re.compile(r'return', re.IGNORECASE),
-            ]
-        }
+        Each call returns its own statement, metadata and notes, so callers
+        may update them (as PDFProcessor and DataCleaner do) without
+        touching the cached copy.
+
+        Args:
+            text: Raw PDF text
+            filename: Original filename for context
+            keep_raw_text: Passed through to parse_statement
+
+        Returns:
+            ProcessedStatement with transactions and metadata
+        """
+        cache_key = (type(self), filename, keep_raw_text, text_digest(text))
+        statement = _STATEMENT_CACHE.get(cache_key)
+        if statement is None:
+            statement = self.parse_statement(text, filename, keep_raw_text)
+            _STATEMENT_CACHE.put(cache_key, statement)
+
+        return statement.model_copy(update={
+            "transactions": list(statement.transactions),
+            "metadata": statement.metadata.model_copy(),
+            "processing_notes": list(statement.processing_notes)
+        })
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Drop every statement cached by parse_statement_cached"""
+        _STATEMENT_CACHE.clear()
 
     @abstractmethod
-    def parse_statement(self, text: str, filename: str = None) -> ProcessedStatement:
+    def parse_statement(self, text: str, filename: str = None, keep_raw_text: bool = False) -> ProcessedStatement:
         """
         Parse statement text and return structured data.
 
         Args:
             text: Raw PDF text
             filename: Original filename for context
+            keep_raw_text: Store text on the statement's raw_text; off by
+                default so parsed statements don't pin the whole PDF text
 
         Returns:
             ProcessedStatement with transactions and metadata
@@ -111,6 +236,21 @@ class BaseStatementParser(ABC):
         """
         pass
 
+    def iter_transactions(self, text: str) -> Iterator[Transaction]:
+        """
+        Yield transactions from text one at a time.
+
+        Parsers that extract lazily override this and build
+        extract_transactions on top of it.
+
+        Args:
+            text: Raw PDF text
+
+        Returns:
+            Iterator of Transaction objects
+        """
+        return iter(self.extract_transactions(text))
+
     def extract_transactions(self, text: str) -> List[Transaction]:
         """
         Extract transactions from text using common patterns.
@@ -123,11 +263,9 @@ class BaseStatementParser(ABC):
             List of Transaction objects
         """
         transactions = []
-        lines = text.split('\n')
 
-        for line_num, line in enumerate(lines):
-            line = line.strip()
-            if not line or self._should_ignore_line(line):
+        for line_num, line in enumerate(self._iter_lines(text)):
+            if self._should_ignore_line(line):
                 continue
 
             transaction = self._parse_transaction_line(line, line_num)
@@ -136,6 +274,15 @@ class BaseStatementParser(ABC):
 
         return transactions
 
+    def _iter_lines(self, text: str) -> Iterator[str]:
+        """
+        Split text once into stripped, non-empty lines.
+
+        Stripping and blank-line filtering run in C via map/filter, so
+        line_num in the extraction loops counts non-empty lines.
+        """
+        return filter(None, map(str.strip, text.split('\n')))
+
     def _parse_transaction_line(self, line: str, line_num: int) -> Optional[Transaction]:
         """
         Parse a single line for transaction data.
@@ -147,6 +294,9 @@ class BaseStatementParser(ABC):
         Returns:
             Transaction object or None if no valid transaction found
         """
+        if not self.date_hint_pattern.search(line):
+            return None
+
         # Look for date pattern
         transaction_date = self._extract_date(line)
         if not transaction_date:
@@ -166,55 +316,71 @@ class BaseStatementParser(ABC):
         # Determine transaction type
         transaction_type = self._classify_transaction_type(description)
 
-        # Handle credit/debit logic
-        if is_credit or transaction_type in [TransactionType.PAYMENT, TransactionType.CREDIT]:
-            amount = -abs(amount)  # Credits are negative
-        else:
-            amount = abs(amount)   # Debits are positive
+        # Payments and credits are credits whatever sign the line showed
+        is_credit = is_credit or transaction_type in (TransactionType.PAYMENT, TransactionType.CREDIT)
+
+        return self._build_transaction(transaction_date, description, amount, transaction_type, is_credit)
+
+    def _build_transaction(
+        self,
+        transaction_date: date,
+        description: str,
+        amount: float,
+        transaction_type: TransactionType,
+        is_credit: bool
+    ) -> Transaction:
+        """
+        Build a Transaction from already-extracted fields.
 
+        Shared by the generic line parser and bank-specific fast paths that
+        capture date, description and amount in one match, so neither has
+        to re-derive fields the other already has.
+
+        Args:
+            transaction_date: Parsed transaction date
+            description: Transaction description
+            amount: Transaction amount; its sign is ignored
+            transaction_type: Classified transaction type
+            is_credit: Whether the amount is a credit
+
+        Returns:
+            Transaction with credits negative and debits positive
+        """
         return Transaction(
             date=transaction_date,
             description=description,
-            amount=amount,
+            amount=-abs(amount) if is_credit else abs(amount),
             transaction_type=transaction_type
         )
 
     def _extract_date(self, line: str) -> Optional[date]:
         """Extract date from line using common patterns"""
-        for pattern in self.date_patterns:
+        for pattern, field_order, separator in self.date_patterns:
+            # A substring test rejects most non-date lines without running the regex
+            if separator is not None and separator not in line:
+                continue
             match = pattern.search(line)
             if match:
                 try:
-                    if len(match.groups()) == 3:
-                        if pattern.pattern.startswith(r'([A-Za-z]{3})'):
-                            # Month name format
-                            month_str, day_str, year_str = match.groups()
-                            month_names = {
-                                'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4,
-                                'may': 5, 'jun': 6, 'jul': 7, 'aug': 8,
-                                'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
-                            }
-                            month = month_names.get(month_str.lower()[:3])
-                            if month:
-                                day = int(day_str)
-                                year = int(year_str)
-                                if year < 100:
-                                    year += 2000
-                                return date(year, month, day)
-                        else:
-                            # Numeric format
-                            parts = [int(g) for g in match.groups()]
-                            if pattern.pattern.startswith(r'(\d{2,4})'):
-                                # YYYY-MM-DD format
-                                year, month, day = parts
-                            else:
-                                # MM/DD/YYYY format
-                                month, day, year = parts
-
+                    if field_order == _DATE_MONTH_NAME:
+                        month_str, day_str, year_str = match.groups()
+                        month = _MONTHS_EN.get(month_str.lower()[:3])
+                        if month:
+                            day = int(day_str)
+                            year = int(year_str)
                             if year < 100:
                                 year += 2000
-
                             return date(year, month, day)
+                    else:
+                        if field_order == _DATE_YMD:
+                            year, month, day = map(int, match.groups())
+                        else:
+                            month, day, year = map(int, match.groups())
+
+                        if year < 100:
+                            year += 2000
+
+                        return date(year, month, day)
                 except (ValueError, TypeError):
                     continue
         return None
@@ -226,7 +392,11 @@ class BaseStatementParser(ABC):
         Returns:
             Tuple of (amount, is_credit)
         """
-        is_credit = 'CR' in line.upper() or line.count('-') > 0
+        # The '-' test stops at the first hit and needs no upper-cased copy;
+        # both substring tests together still beat one CR|- regex search, and
+        # upper() plus 'in' runs several times faster than a re.IGNORECASE
+        # search for CR even on long lines, so the copy is worth making
+        is_credit = '-' in line or 'CR' in line.upper()
 
         for pattern in self.amount_patterns:
             matches = pattern.findall(line)
@@ -247,23 +417,32 @@ class BaseStatementParser(ABC):
         description = line
 
         # Remove date patterns
-        for pattern in self.date_patterns:
-            description = pattern.sub('', description)
+        for pattern, _, separator in self.date_patterns:
+            if separator is None or separator in description:
+                description = pattern.sub('', description)
 
-        # Remove amount patterns
-        for pattern in self.amount_patterns:
-            description = pattern.sub('', description)
+        # Remove amounts. The first amount pattern matches at every digit or
+        # comma, so after it the other amount patterns can never match.
+        description = self.amount_patterns[0].sub('', description)
 
-        # Remove common noise
-        description = re.sub(r'\s*CR\s*', '', description, flags=re.IGNORECASE)
-        description = re.sub(r'\s*DB\s*', '', description, flags=re.IGNORECASE)
-        description = re.sub(r'\$', '', description)
-        description = re.sub(r'\s+', ' ', description)
+        # Remove common noise. Dropping the dollar signs after the markers
+        # cannot form a new marker that the old regex chain would have removed,
+        # and split/join collapses whitespace exactly like \s+ plus strip().
+        for marker, pattern in self.description_noise_patterns:
+            if marker in description.upper():
+                description = pattern.sub('', description)
+        description = description.replace('$', '')
 
-        return description.strip()
+        return ' '.join(description.split())
 
     def _classify_transaction_type(self, description: str) -> TransactionType:
         """Classify transaction type based on description"""
+        if description.isascii():
+            # Collapsing whitespace lets the keyword scan stand in for each \s+
+            desc_lower = ' '.join(description.lower().split())
+            transaction_type = _BASE_TYPE_MATCHER.first_value(desc_lower, _BASE_TYPE_PRIORITY)
+            return transaction_type or TransactionType.PURCHASE
+
         for trans_type, patterns in self.transaction_type_patterns.items():
             for pattern in patterns:
                 if pattern.search(description):
@@ -273,33 +452,40 @@ class BaseStatementParser(ABC):
 
     def _should_ignore_line(self, line: str) -> bool:
         """Check if line should be ignored during parsing"""
-        ignore_patterns = [
-            r'^Page\s+\d+',
-            r'^Statement\s+Date',
-            r'^Account\s+Number',
-            r'^Total\s+',
-            r'^Balance\s+',
-            r'^Previous\s+Balance',
-            r'^New\s+Balance',
-            r'^\s*$',
-            r'^-+\s*$',
-            r'^=+\s*$',
-        ]
-
-        for pattern in ignore_patterns:
-            if re.match(pattern, line, re.IGNORECASE):
-                return True
-
-        return False
+        return bool(self.common_ignore_pattern.match(line))
 
     def _parse_date_string(self, date_str: str) -> Optional[date]:
-        """Parse date string using various formats"""
+        """
+        Parse date string using various formats.
+
+        Numeric formats are matched with a precompiled regex and built with
+        date() directly; strptime re-validates its format and raises on
+        every miss, which dominated the cost of trying several formats.
+        """
         if not date_str:
             return None
 
+        date_str = date_str.strip()
         for fmt in self.config.date_formats:
+            pattern = _compile_numeric_date_format(fmt)
+            if pattern is None:
+                try:
+                    return datetime.strptime(date_str, fmt).date()
+                except ValueError:
+                    continue
+
+            match = pattern.fullmatch(date_str)
+            if not match:
+                continue
+            fields = match.groupdict()
+            if 'Y' in fields:
+                year = int(fields['Y'])
+            else:
+                # strptime's %y pivot: 69-99 are 1900s, 00-68 are 2000s
+                year = int(fields['y'])
+                year += 2000 if year <= 68 else 1900
             try:
-                return datetime.strptime(date_str.strip(), fmt).date()
+                return date(year, int(fields['m']), int(fields['d']))
             except ValueError:
                 continue
 
@@ -338,13 +524,15 @@ class BaseStatementParser(ABC):
         if not statement.metadata.balance:
             warnings.append("Account balance not found")
 
-        # Check for suspicious patterns
-        zero_amount_count = sum(1 for t in statement.transactions if t.amount == 0)
+        # Check for suspicious patterns; columns are pulled out with map so
+        # the counting and min/max below run in C
+        amounts = list(map(attrgetter('amount'), statement.transactions))
+        zero_amount_count = amounts.count(0)
         if zero_amount_count > len(statement.transactions) * 0.1:  # More than 10%
             warnings.append(f"High number of zero-amount transactions ({zero_amount_count})")
 
         # Check date consistency
-        dates = [t.date for t in statement.transactions if t.date]
+        dates = list(filter(None, map(attrgetter('date'), statement.transactions)))
         if dates:
             date_range = max(dates) - min(dates)
             if date_range.days > 35:  # More than ~1 month
@@ -0,0 +1,66 @@
+"""
+Parallel parsing of many statement texts.
+"""
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple, Type
+
+try:
+    from ...models import ProcessedStatement
+except ImportError:
+    from models.statement_data import ProcessedStatement
+from .base_parser import BaseStatementParser
+
+# Texts sent to a worker per round trip; amortizes pickling without starving workers
+PARSE_CHUNK_SIZE = 4
+
+# Smaller batches are parsed inline; starting a pool costs more than it saves
+PARALLEL_PARSE_THRESHOLD = 4
+
+
+@lru_cache(maxsize=None)
+def _get_worker_parser(parser_class: Type[BaseStatementParser]) -> BaseStatementParser:
+    """Build one parser per class in each worker process"""
+    return parser_class()
+
+
+def _parse_in_worker(job: Tuple[Type[BaseStatementParser], str]) -> ProcessedStatement:
+    """Pool worker entry point; only the class and the text are pickled"""
+    parser_class, text = job
+    return _get_worker_parser(parser_class).parse_statement(text)
+
+
+def parse_many(
+    texts: Iterable[str],
+    parser_class: Type[BaseStatementParser],
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None
+) -> List[ProcessedStatement]:
+    """
+    Parse many statement texts with the same parser across processes.
+
+    Parsing is regex-bound Python code, so threads would serialize on the
+    GIL; each statement is parsed in a worker process instead. Batches
+    below PARALLEL_PARSE_THRESHOLD are parsed in the calling process.
+
+    Args:
+        texts: Extracted statement texts
+        parser_class: Parser class that extends BaseStatementParser
+        executor: Existing pool to run on; a temporary ProcessPoolExecutor
+            is created (and shut down) when omitted
+        max_workers: Size of the temporary pool
+
+    Returns:
+        List of ProcessedStatement objects in the order of texts
+    """
+    texts = list(texts)
+    if len(texts) < PARALLEL_PARSE_THRESHOLD:
+        return [_parse_in_worker((parser_class, text)) for text in texts]
+
+    jobs = ((parser_class, text) for text in texts)
+
+    if executor is not None:
+        return list(executor.map(_parse_in_worker, jobs, chunksize=PARSE_CHUNK_SIZE))
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_parse_in_worker, jobs, chunksize=PARSE_CHUNK_SIZE))
@@ -3,55 +3,101 @@ Chase Credit Card statement parser.
 """
 import re
 from datetime import date
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 try:
     from .base_parser import BaseStatementParser
+    from ...utils.keyword_matcher import KeywordMatcher
     from ...models import ProcessedStatement, StatementMetadata, BankType, Transaction, TransactionType
 except ImportError:
     from services.bank_parsers.base_parser import BaseStatementParser
+    from utils.keyword_matcher import KeywordMatcher
     from models.statement_data import ProcessedStatement, StatementMetadata, BankType, Transaction, TransactionType
 
 
+# Chase transaction types by description keyword, in priority order
+_CHASE_TYPE_KEYWORDS = (
+    (TransactionType.PAYMENT, ('PAYMENT', 'AUTOPAY', 'THANK YOU')),
+    (TransactionType.FEE, ('ANNUAL FEE', 'LATE FEE', 'OVERLIMIT')),
+    (TransactionType.INTEREST, ('INTEREST', 'FINANCE CHARGE')),
+    (TransactionType.CASH_ADVANCE, ('CASH ADVANCE', 'ATM WITHDRAWAL')),
+    (TransactionType.CREDIT, ('CREDIT', 'REFUND', 'RETURN')),
+)
+_CHASE_TYPE_PRIORITY = tuple(transaction_type for transaction_type, _ in _CHASE_TYPE_KEYWORDS)
+_CHASE_TYPE_MATCHER = KeywordMatcher(
+    (keyword, transaction_type)
+    for transaction_type, keywords in _CHASE_TYPE_KEYWORDS
+    for keyword in keywords
+)
+
+
 class ChaseParser(BaseStatementParser):
     """Parser for Chase credit card statements"""
 
+    # Chase-specific patterns, compiled once and shared by every instance
+    statement_date_pattern = re.compile(
+        r'Statement\s+Date:?\s*(\d{1,2}/\d{1,2}/\d{2,4})',
+        re.IGNORECASE
+    )
+
+    payment_due_pattern = re.compile(
+        r'Payment\s+Due\s+Date:?\s*(\d{1,2}/\d{1,2}/\d{2,4})',
+        re.IGNORECASE
+    )
+
+    balance_pattern = re.compile(
+        r'New\s+Balance:?\s*\$?([0-9,]+\.?\d{0,2})',
+        re.IGNORECASE
+    )
+
+    account_pattern = re.compile(
+        r'Account\s+Number:?\s*[*\-x]*(\d{4})',
+        re.IGNORECASE
+    )
+
+    # Statement Period and Billing Period lines, tried in order
+    period_patterns = (
+        re.compile(r'Statement\s+Period:?\s*([^\n]+)', re.IGNORECASE),
+        re.compile(r'Billing\s+Period:?\s*([^\n]+)', re.IGNORECASE),
+    )
+
+    # Chase transaction line patterns
+    transaction_patterns = (
+        # Format: MM/DD Description Amount
+        re.compile(r'^(\d{1,2}/\d{1,2})\s+(.+?)\s+([0-9,]+\.?\d{0,2})$'),
+        # Format: MM/DD Description $Amount
+        re.compile(r'^(\d{1,2}/\d{1,2})\s+(.+?)\s+\$([0-9,]+\.?\d{0,2})$'),
+        # Format: MM/DD/YY Description Amount
+        re.compile(r'^(\d{1,2}/\d{1,2}/\d{2})\s+(.+?)\s+([0-9,]+\.?\d{0,2})$'),
+    )
+
+    year_pattern = re.compile(r'20\d{2}')
+
+    # Chase header and summary lines that never hold transactions
+    chase_ignore_pattern = re.compile(
+        '|'.join(f'(?:{pattern})' for pattern in (
+            r'^CHASE',
+            r'^Customer Service',
+            r'^Account Summary',
+            r'^Previous Balance',
+            r'^Payments and Credits',
+            r'^Purchases',
+            r'^Fees',
+            r'^Interest Charged',
+            r'^Page \d+',
+        )),
+        re.IGNORECASE
+    )
+
     def __init__(self):
         super().__init__(BankType.CHASE)
 
-        # Chase-specific patterns
-        self.statement_date_pattern = re.compile(
-            r'Statement\s+Date:?\s*(\d{1,2}/\d{1,2}/\d{2,4})',
-            re.IGNORECASE
-        )
+    def parse_statement(self, text: str, filename: str = None, keep_raw_text: bool = False) -> ProcessedStatement:
+        """
+        Parse Chase credit card statement.
 
-        self.payment_due_pattern = re.compile(
-            r'Payment\s+Due\s+Date:?\s*(\d{1,2}/\d{1,2}/\d{2,4})',
-            re.IGNORECASE
-        )
-
-        self.balance_pattern = re.compile(
-            r'New\s+Balance:?\s*\$?([0-9,]+\.?\d{0,2})',
-            re.IGNORECASE
-        )
-
-        self.account_pattern = re.compile(
-            r'Account\s+Number:?\s*[*\-x]*(\d{4})',
-            re.IGNORECASE
-        )
-
-        # Chase transaction line patterns
-        self.transaction_patterns = [
-            # Format: MM/DD Description Amount
-            re.compile(r'^(\d{1,2}/\d{1,2})\s+(.+?)\s+([0-9,]+\.?\d{0,2})$'),
-            # Format: MM/DD Description $Amount
-            re.compile(r'^(\d{1,2}/\d{1,2})\s+(.+?)\s+\$([0-9,]+\.?\d{0,2})$'),
-            # Format: MM/DD/YY Description Amount
-            re.compile(r'^(\d{1,2}/\d{1,2}/\d{2})\s+(.+?)\s+([0-9,]+\.?\d{0,2})$'),
-        ]
-
-    def parse_statement(self, text: str, filename: str = None) -> ProcessedStatement:
-        """Parse Chase credit card statement"""
+        The statement only holds on to text when keep_raw_text is set.
+        """
         # Extract metadata
         metadata = self.extract_metadata(text)
 
@@ -66,7 +112,7 @@ class ChaseParser(BaseStatementParser):
         return ProcessedStatement(
             transactions=transactions,
             metadata=metadata,
-            raw_text=text,
+            raw_text=text if keep_raw_text else None,
             processing_notes=notes
         )
 
@@ -88,30 +134,24 @@ class ChaseParser(BaseStatementParser):
 
     def extract_transactions(self, text: str) -> List[Transaction]:
         """Extract transactions with Chase-specific logic"""
-        transactions = []
-        lines = text.split('\n')
-        current_year = None
+        return list(self.iter_transactions(text))
 
+    def iter_transactions(self, text: str) -> Iterator[Transaction]:
+        """Yield Chase transactions in statement order"""
         # Try to determine the statement year
-        for line in lines:
-            year_match = re.search(r'20\d{2}', line)
-            if year_match:
-                current_year = int(year_match.group())
-                break
-
-        if not current_year:
-            current_year = 2024  # Default fallback
-
-        for line_num, line in enumerate(lines):
-            line = line.strip()
-            if not line or self._should_ignore_line(line):
+        year_match = self.year_pattern.search(text)
+        current_year = int(year_match.group()) if year_match else 2024  # Default fallback
+
+        should_ignore_line = self._should_ignore_line
+        parse_transaction = self._parse_chase_transaction
+
+        for line_num, line in enumerate(self._iter_lines(text)):
+            if should_ignore_line(line):
                 continue
 
-            transaction = self._parse_chase_transaction(line, current_year, line_num)
+            transaction = parse_transaction(line, current_year, line_num)
             if transaction:
-                transactions.append(transaction)
-
-        return transactions
+                yield transaction
 
     def _parse_chase_transaction(self, line: str, year: int, line_num: int) -> Optional[Transaction]:
         """Parse a Chase-specific transaction line"""
@@ -133,19 +173,16 @@ class ChaseParser(BaseStatementParser):
                     amount = float(amount_str.replace(',', ''))
 
                     # Determine if it's a credit (Chase shows credits as negative)
-                    is_credit = description.upper().startswith('PAYMENT') or 'CREDIT' in description.upper()
-
-                    if is_credit:
-                        amount = -abs(amount)
+                    desc_upper = description.upper()
+                    is_credit = desc_upper.startswith('PAYMENT') or 'CREDIT' in desc_upper
 
                     # Classify transaction type
-                    transaction_type = self._classify_chase_transaction(description)
+                    transaction_type = self._classify_chase_transaction(description, desc_upper)
 
-                    return Transaction(
-                        date=transaction_date,
-                        description=description,
-                        amount=amount,
-                        transaction_type=transaction_type
+                    # The pattern already captured every field, so skip the
+                    # base class's extraction passes and only build the result
+                    return self._build_transaction(
+                        transaction_date, description, amount, transaction_type, is_credit
                     )
 
                 except (ValueError, IndexError) as e:
@@ -171,23 +208,13 @@ class ChaseParser(BaseStatementParser):
             pass
         return None
 
-    def _classify_chase_transaction(self, description: str) -> TransactionType:
-        """Classify Chase transaction types"""
-        desc_upper = description.upper()
-
-        # Chase-specific patterns
-        if any(keyword in desc_upper for keyword in ['PAYMENT', 'AUTOPAY', 'THANK YOU']):
-            return TransactionType.PAYMENT
-        elif any(keyword in desc_upper for keyword in ['ANNUAL FEE', 'LATE FEE', 'OVERLIMIT']):
-            return TransactionType.FEE
-        elif any(keyword in desc_upper for keyword in ['INTEREST', 'FINANCE CHARGE']):
-            return TransactionType.INTEREST
-        elif any(keyword in desc_upper for keyword in ['CASH ADVANCE', 'ATM WITHDRAWAL']):
-            return TransactionType.CASH_ADVANCE
-        elif any(keyword in desc_upper for keyword in ['CREDIT', 'REFUND', 'RETURN']):
-            return TransactionType.CREDIT
-        else:
-            return TransactionType.PURCHASE
+    def _classify_chase_transaction(self, description: str, desc_upper: Optional[str] = None) -> TransactionType:
+        """Classify Chase transaction types; pass desc_upper when the caller already has it"""
+        if desc_upper is None:
+            desc_upper = description.upper()
+
+        transaction_type = _CHASE_TYPE_MATCHER.first_value(desc_upper, _CHASE_TYPE_PRIORITY)
+        return transaction_type or TransactionType.PURCHASE
 
     def _extract_statement_period(self, text: str) -> Optional[str]:
         """Extract statement period from Chase text"""
@@ -197,13 +224,8 @@ class ChaseParser(BaseStatementParser):
             return f"Statement Date: {match.group(1)}"
 
         # Alternative patterns
-        period_patterns = [
-            r'Statement\s+Period:?\s*([^\n]+)',
-            r'Billing\s+Period:?\s*([^\n]+)',
-        ]
-
-        for pattern in period_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in self.period_patterns:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
 
@@ -232,20 +254,7 @@ class ChaseParser(BaseStatementParser):
 
     def _should_ignore_line(self, line: str) -> bool:
         """Chase-specific line filtering"""
-        chase_ignore_patterns = [
-            r'^CHASE',
-            r'^Customer Service',
-            r'^Account Summary',
-            r'^Previous Balance',
-            r'^Payments and Credits',
-            r'^Purchases',
-            r'^Fees',
-            r'^Interest Charged',
-            r'^Page \d+',
-        ]
-
-        for pattern in chase_ignore_patterns:
-            if re.match(pattern, line, re.IGNORECASE):
-                return True
+        if self.chase_ignore_pattern.match(line):
+            return True
 
         return super()._should_ignore_line(line)
\ No newline at end of file
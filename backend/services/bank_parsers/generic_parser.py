@@ -2,54 +2,148 @@
 Generic credit card statement parser for unknown/unsupported banks.
 """
 import re
+from collections import Counter
 from datetime import date
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
 try:
-    from .base_parser import BaseStatementParser
+    from .base_parser import BaseStatementParser, _MONTHS_EN
+    from ...utils.keyword_matcher import KeywordMatcher
     from ...models import ProcessedStatement, StatementMetadata, BankType, Transaction, TransactionType
 except ImportError:
-    from services.bank_parsers.base_parser import BaseStatementParser
+    from services.bank_parsers.base_parser import BaseStatementParser, _MONTHS_EN
+    from utils.keyword_matcher import KeywordMatcher
     from models.statement_data import ProcessedStatement, StatementMetadata, BankType, Transaction, TransactionType
 
 
+# Generic transaction types by description keyword, in priority order;
+# these work across banks
+_GENERIC_TYPE_KEYWORDS = (
+    (TransactionType.PAYMENT, ('PAYMENT', 'PAY', 'AUTOPAY', 'THANK YOU')),
+    (TransactionType.FEE, ('FEE', 'CHARGE', 'ANNUAL', 'LATE')),
+    (TransactionType.INTEREST, ('INTEREST', 'FINANCE', 'APR')),
+    (TransactionType.CASH_ADVANCE, ('CASH ADVANCE', 'ATM', 'WITHDRAWAL')),
+    (TransactionType.CREDIT, ('CREDIT', 'REFUND', 'RETURN', 'ADJUSTMENT')),
+)
+_GENERIC_TYPE_PRIORITY = tuple(transaction_type for transaction_type, _ in _GENERIC_TYPE_KEYWORDS)
+_GENERIC_TYPE_MATCHER = KeywordMatcher(
+    (keyword, transaction_type)
+    for transaction_type, keywords in _GENERIC_TYPE_KEYWORDS
+    for keyword in keywords
+)
+
+# Date formats captured by the transaction line patterns
+_DATE_SLASH, _DATE_MONTH_NAME = range(2)
+
+# Leading part of a statement searched for the bank name before the rest
+_BANK_NAME_HEAD_CHARS = 8192
+
+# Non-digit characters a transaction line pattern can end on: the tail of
+# an amount like "1,234." or of a CR/DB marker
+_AMOUNT_END_CHARS = frozenset(',.RB')
+
+
 class GenericParser(BaseStatementParser):
     """Generic parser for unknown credit card statements"""
 
+    # Transaction line patterns - most flexible. Each captures date,
+    # description, amount and an optional CR/DB marker, in that order, and
+    # is tagged with the format of the date it captures
+    transaction_line_patterns = (
+        # Date at start, amount at end with dollar sign
+        (re.compile(r'^(\d{1,2}/\d{1,2}(?:/\d{2,4})?)\s+(.+?)\s+\$([0-9,]+\.?\d{0,2})(?:\s*(CR|DB))?$'), _DATE_SLASH),
+        # Date at start, amount at end without dollar sign
+        (re.compile(r'^(\d{1,2}/\d{1,2}(?:/\d{2,4})?)\s+(.+?)\s+([0-9,]+\.?\d{0,2})(?:\s*(CR|DB))?$'), _DATE_SLASH),
+        # Month name date format
+        (re.compile(r'^([A-Za-z]{3}\s+\d{1,2})\s+(.+?)\s+\$?([0-9,]+\.?\d{0,2})(?:\s*(CR|DB))?$'), _DATE_MONTH_NAME),
+    )
+
+    # The same patterns as one alternation, each wrapped in a group of its
+    # own. The patterns are anchored at both ends, so the first alternative
+    # that matches is the first pattern that would, and a non-transaction
+    # line costs one regex call instead of three
+    transaction_line_pattern = re.compile(
+        '|'.join(f'({pattern.pattern})' for pattern, _ in transaction_line_patterns)
+    )
+
+    # Header, footer and separator lines that never hold transactions
+    generic_ignore_pattern = re.compile(
+        '|'.join(f'(?:{pattern})' for pattern in (
+            r'^Page\s+\d+',
+            r'^Statement\s+Date',
+            r'^Account\s+Number',
+            r'^Payment\s+Due',
+            r'^Previous\s+Balance',
+            r'^New\s+Balance',
+            r'^Total\s+',
+            r'^Summary',
+            r'^Customer\s+Service',
+            r'^Questions\?',
+            r'^Visit\s+us',
+            r'^Call\s+us',
+            r'^www\.',
+            r'^http',
+            r'^\d+\s*$',  # Just numbers
+            r'^-+\s*$',   # Just dashes
+            r'^=+\s*$',   # Just equals
+            r'^\s*$',     # Empty lines
+        )),
+        re.IGNORECASE
+    )
+
+    # Bank names by statement pattern, in priority order. Each is searched
+    # separately: most start with a literal, which SRE finds with a fast
+    # skip-ahead scan, and that measured several times faster than one
+    # Aho-Corasick or fused pass collecting every match over the whole text
+    bank_name_patterns = (
+        (re.compile(r'chase'), 'Chase'),
+        (re.compile(r'american\s+express|amex'), 'American Express'),
+        (re.compile(r'citibank|citi'), 'Citibank'),
+        (re.compile(r'bank\s+of\s+america'), 'Bank of America'),
+        (re.compile(r'capital\s+one'), 'Capital One'),
+        (re.compile(r'wells\s+fargo'), 'Wells Fargo'),
+        (re.compile(r'discover'), 'Discover'),
+        (re.compile(r'synchrony'), 'Synchrony Bank'),
+        (re.compile(r'barclays'), 'Barclays'),
+    )
+
+    # Generic patterns that work across multiple banks, compiled once and
+    # shared by every instance
+    balance_patterns = (
+        re.compile(r'(?:new|current|total|outstanding)\s+balance:?\s*\$?([0-9,]+\.?\d{0,2})', re.IGNORECASE),
+        re.compile(r'balance:?\s*\$?([0-9,]+\.?\d{0,2})', re.IGNORECASE),
+        re.compile(r'\$([0-9,]+\.?\d{0,2})\s+(?:balance|total)', re.IGNORECASE),
+    )
+
+    due_date_patterns = (
+        re.compile(r'(?:payment\s+)?due\s+date:?\s*(\d{1,2}/\d{1,2}/\d{2,4})', re.IGNORECASE),
+        re.compile(r'(?:payment\s+)?due\s+date:?\s*([A-Za-z]{3}\s+\d{1,2},?\s+\d{4})', re.IGNORECASE),
+        re.compile(r'due:?\s*(\d{1,2}/\d{1,2}/\d{2,4})', re.IGNORECASE),
+    )
+
+    statement_date_patterns = (
+        re.compile(r'statement\s+date:?\s*(\d{1,2}/\d{1,2}/\d{2,4})', re.IGNORECASE),
+        re.compile(r'statement\s+date:?\s*([A-Za-z]{3}\s+\d{1,2},?\s+\d{4})', re.IGNORECASE),
+        re.compile(r'closing\s+date:?\s*(\d{1,2}/\d{1,2}/\d{2,4})', re.IGNORECASE),
+    )
+
+    account_patterns = (
+        re.compile(r'account\s+(?:number|#):?\s*[*\-x]*(\d{4,5})', re.IGNORECASE),
+        re.compile(r'acct\s+(?:number|#):?\s*[*\-x]*(\d{4,5})', re.IGNORECASE),
+        re.compile(r'ending\s+in:?\s*(\d{4,5})', re.IGNORECASE),
+    )
+
+    year_pattern = re.compile(r'20\d{2}')
+
     def __init__(self):
         super().__init__(BankType.GENERIC)
 
-        # Generic patterns that work across multiple banks
-        self.balance_patterns = [
-            re.compile(r'(?:new|current|total|outstanding)\s+balance:?\s*\$?([0-9,]+\.?\d{0,2})', re.IGNORECASE),
-            re.compile(r'balance:?\s*\$?([0-9,]+\.?\d{0,2})', re.IGNORECASE),
-            re.compile(r'\$([0-9,]+\.?\d{0,2})\s+(?:balance|total)', re.IGNORECASE),
-        ]
-
-        self.due_date_patterns = [
-            re.compile(r'(?:payment\s+)?due\s+date:?\s*(\d{1,2}/\d{1,2}/\d{2,4})', re.IGNORECASE),
-            re.compile(r'(?:payment\s+)?due\s+date:?\s*([A-Za-z]{3}\s+\d{1,2},?\s+\d{4})', re.IGNORECASE),
-            re.compile(r'due:?\s*(\d{1,2}/\d{1,2}/\d{2,4})', re.IGNORECASE),
-        ]
-
-        self.statement_date_patterns = [
-            re.compile(r'statement\s+date:?\s*(\d{1,2}/\d{1,2}/\d{2,4})', re.IGNORECASE),
-            re.compile(r'statement\s+date:?\s*([A-Za-z]{3}\s+\d{1,2},?\s+\d{4})', re.IGNORECASE),
-            re.compile(r'closing\s+date:?\s*(\d{1,2}/\d{1,2}/\d{2,4})', re.IGNORECASE),
-        ]
-
-        # Transaction line patterns - most flexible
-        self.transaction_line_patterns = [
-            # Date at start, amount at end with dollar sign
-            re.compile(r'^(\d{1,2}/\d{1,2}(?:/\d{2,4})?)\s+(.+?)\s+\$([0-9,]+\.?\d{0,2})(?:\s*(CR|DB))?$'),
-            # Date at start, amount at end without dollar sign
-            re.compile(r'^(\d{1,2}/\d{1,2}(?:/\d{2,4})?)\s+(.+?)\s+([0-9,]+\.?\d{0,2})(?:\s*(CR|DB))?$'),
-            # Month name date format
-            re.compile(r'^([A-Za-z]{3}\s+\d{1,2})\s+(.+?)\s+\$?([0-9,]+\.?\d{0,2})(?:\s*(CR|DB))?$'),
-        ]
-
-    def parse_statement(self, text: str, filename: str = None) -> ProcessedStatement:
-        """Parse generic credit card statement"""
+    def parse_statement(self, text: str, filename: str = None, keep_raw_text: bool = False) -> ProcessedStatement:
+        """
+        Parse generic credit card statement.
+
+        The statement only holds on to text when keep_raw_text is set.
+        """
         metadata = self.extract_metadata(text)
         transactions = self.extract_transactions(text)
 
@@ -63,7 +157,7 @@ class GenericParser(BaseStatementParser):
         return ProcessedStatement(
             transactions=transactions,
             metadata=metadata,
-            raw_text=text,
+            raw_text=text if keep_raw_text else None,
             processing_notes=notes
         )
 
@@ -86,70 +180,104 @@ class GenericParser(BaseStatementParser):
 
     def extract_transactions(self, text: str) -> List[Transaction]:
         """Extract transactions using generic patterns"""
-        transactions = []
-        lines = text.split('\n')
+        return list(self.iter_transactions(text))
+
+    def iter_transactions(self, text: str) -> Iterator[Transaction]:
+        """Yield generic transactions in statement order"""
         current_year = self._detect_year(text)
 
-        for line_num, line in enumerate(lines):
-            line = line.strip()
-            if not line or self._should_ignore_line(line):
+        should_ignore_line = self._should_ignore_line
+        parse_transaction = self._parse_generic_transaction
+
+        for line_num, line in enumerate(self._iter_lines(text)):
+            if should_ignore_line(line):
                 continue
 
-            transaction = self._parse_generic_transaction(line, current_year, line_num)
+            transaction = parse_transaction(line, current_year, line_num)
             if transaction:
-                transactions.append(transaction)
-
-        return transactions
+                yield transaction
 
     def _parse_generic_transaction(self, line: str, year: int, line_num: int) -> Optional[Transaction]:
         """Parse a generic transaction line"""
-        for pattern in self.transaction_line_patterns:
-            match = pattern.match(line)
-            if match:
-                try:
-                    groups = match.groups()
-                    date_str = groups[0]
-                    description = groups[1].strip()
-                    amount_str = groups[2]
-                    credit_indicator = groups[3] if len(groups) > 3 else None
-
-                    # Parse date
-                    transaction_date = self._parse_generic_date(date_str, year)
-                    if not transaction_date:
-                        continue
-
-                    # Parse amount
-                    amount = float(amount_str.replace(',', ''))
-
-                    # Determine if it's a credit
-                    is_credit = (credit_indicator == 'CR' or
-                               description.upper().startswith('PAYMENT') or
-                               'CREDIT' in description.upper() or
-                               'REFUND' in description.upper())
-
-                    if is_credit:
-                        amount = -abs(amount)
-
-                    # Classify transaction type
-                    transaction_type = self._classify_generic_transaction(description)
-
-                    return Transaction(
-                        date=transaction_date,
-                        description=description,
-                        amount=amount,
-                        transaction_type=transaction_type
-                    )
-
-                except (ValueError, IndexError):
-                    continue
+        # Every transaction line pattern starts with a date (a digit or a
+        # month name) and ends with an amount or a CR/DB marker; testing
+        # both ends keeps other lines out of the lazy description scan
+        first, last = line[:1], line[-1:]
+        match = None
+        if (first.isdecimal() or first.isalpha()) and (last.isdecimal() or last in _AMOUNT_END_CHARS):
+            match = self.transaction_line_pattern.match(line)
+        if match:
+            # lastindex is the wrapping group of the alternative that matched;
+            # its four capture groups follow it
+            wrapper = match.lastindex
+            index = wrapper // 5
+            transaction = self._generic_transaction_from_groups(
+                match.group(wrapper + 1, wrapper + 2, wrapper + 3, wrapper + 4),
+                year,
+                self.transaction_line_patterns[index][1]
+            )
+            if transaction:
+                return transaction
+
+            # Fields that fail to parse fall through to the later patterns
+            for pattern, date_format in self.transaction_line_patterns[index + 1:]:
+                match = pattern.match(line)
+                if match:
+                    transaction = self._generic_transaction_from_groups(match.groups(), year, date_format)
+                    if transaction:
+                        return transaction
 
         # Fallback to base parser logic
         return super()._parse_transaction_line(line, line_num)
 
-    def _parse_generic_date(self, date_str: str, year: int) -> Optional[date]:
-        """Parse date in various formats"""
+    def _generic_transaction_from_groups(
+        self,
+        groups: Tuple[Optional[str], ...],
+        year: int,
+        date_format: int
+    ) -> Optional[Transaction]:
+        """Build a transaction from one transaction line pattern's groups"""
+        try:
+            date_str, description, amount_str, credit_indicator = groups
+            description = description.strip()
+
+            # Parse date
+            transaction_date = self._parse_generic_date(date_str, year, date_format)
+            if not transaction_date:
+                return None
+
+            # Parse amount; float() on the comma-free string is C code and beats
+            # any per-character digit loop written in Python
+            amount = float(amount_str.replace(',', ''))
+
+            # Determine if it's a credit; substring tests on one upper-cased
+            # copy run several times faster than a re.IGNORECASE search
+            desc_upper = description.upper()
+            is_credit = (credit_indicator == 'CR' or
+                         desc_upper.startswith('PAYMENT') or
+                         'CREDIT' in desc_upper or
+                         'REFUND' in desc_upper)
+
+            # Classify transaction type
+            transaction_type = self._classify_generic_transaction(description, desc_upper)
+
+            return self._build_transaction(transaction_date, description, amount, transaction_type, is_credit)
+
+        except (ValueError, IndexError):
+            return None
+
+    def _parse_generic_date(self, date_str: str, year: int, date_format: Optional[int] = None) -> Optional[date]:
+        """
+        Parse date in various formats.
+
+        Callers that know which pattern captured date_str pass its
+        date_format tag; otherwise the format is inferred from the string.
+        """
+        if date_format is None:
+            date_format = _DATE_SLASH if '/' in date_str else _DATE_MONTH_NAME
+
         try:
-            if '/' in date_str:
+            if date_format == _DATE_SLASH:
                 parts = date_str.split('/')
                 if len(parts) == 2:
                     month, day = int(parts[0]), int(parts[1])
@@ -161,16 +289,10 @@ class GenericParser(BaseStatementParser):
                     return date(year_part, month, day)
             else:
                 # Try month name format
-                month_names = {
-                    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4,
-                    'may': 5, 'jun': 6, 'jul': 7, 'aug': 8,
-                    'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
-                }
-
                 parts = date_str.split()
                 if len(parts) == 2:
                     month_str, day_str = parts
-                    month = month_names.get(month_str.lower()[:3])
+                    month = _MONTHS_EN.get(month_str.lower()[:3])
                     if month:
                         day = int(day_str)
                         return date(year, month, day)
@@ -178,51 +300,42 @@ class GenericParser(BaseStatementParser):
             pass
         return None
 
-    def _classify_generic_transaction(self, description: str) -> TransactionType:
-        """Generic transaction classification"""
-        desc_upper = description.upper()
-
-        # Generic patterns that work across banks
-        if any(keyword in desc_upper for keyword in ['PAYMENT', 'PAY', 'AUTOPAY', 'THANK YOU']):
-            return TransactionType.PAYMENT
-        elif any(keyword in desc_upper for keyword in ['FEE', 'CHARGE', 'ANNUAL', 'LATE']):
-            return TransactionType.FEE
-        elif any(keyword in desc_upper for keyword in ['INTEREST', 'FINANCE', 'APR']):
-            return TransactionType.INTEREST
-        elif any(keyword in desc_upper for keyword in ['CASH ADVANCE', 'ATM', 'WITHDRAWAL']):
-            return TransactionType.CASH_ADVANCE
-        elif any(keyword in desc_upper for keyword in ['CREDIT', 'REFUND', 'RETURN', 'ADJUSTMENT']):
-            return TransactionType.CREDIT
-        else:
-            return TransactionType.PURCHASE
+    def _classify_generic_transaction(self, description: str, desc_upper: Optional[str] = None) -> TransactionType:
+        """Generic transaction classification; pass desc_upper when the caller already has it"""
+        if desc_upper is None:
+            desc_upper = description.upper()
+
+        transaction_type = _GENERIC_TYPE_MATCHER.first_value(desc_upper, _GENERIC_TYPE_PRIORITY)
+        return transaction_type or TransactionType.PURCHASE
 
     def _detect_bank_name(self, text: str) -> str:
-        """Try to detect bank name from text"""
-        bank_indicators = [
-            (r'chase', 'Chase'),
-            (r'american\s+express|amex', 'American Express'),
-            (r'citibank|citi', 'Citibank'),
-            (r'bank\s+of\s+america', 'Bank of America'),
-            (r'capital\s+one', 'Capital One'),
-            (r'wells\s+fargo', 'Wells Fargo'),
-            (r'discover', 'Discover'),
-            (r'synchrony', 'Synchrony Bank'),
-            (r'barclays', 'Barclays'),
-        ]
-
-        text_lower = text.lower()
-        for pattern, name in bank_indicators:
-            if re.search(pattern, text_lower):
+        """
+        Try to detect bank name from text.
+
+        Statements name their bank in the header, so the first
+        _BANK_NAME_HEAD_CHARS are searched on their own first. That keeps
+        the nine searches off the rest of a long statement, and keeps a
+        merchant further down (a CHASE ATM on another bank's statement)
+        from outranking the header. The whole text is only searched when
+        the header names no bank.
+        """
+        name = self._match_bank_name(text[:_BANK_NAME_HEAD_CHARS].lower())
+        if name is None and len(text) > _BANK_NAME_HEAD_CHARS:
+            name = self._match_bank_name(text.lower())
+        return name or "Unknown Bank"
+
+    def _match_bank_name(self, text_lower: str) -> Optional[str]:
+        """Return the first bank in table order named in lower-cased text"""
+        for pattern, name in self.bank_name_patterns:
+            if pattern.search(text_lower):
                 return name
-
-        return "Unknown Bank"
+        return None
 
     def _detect_year(self, text: str) -> int:
         """Try to detect the statement year"""
-        year_matches = re.findall(r'20\d{2}', text)
+        year_matches = self.year_pattern.findall(text)
         if year_matches:
             # Return the most common year
-            from collections import Counter
             most_common_year = Counter(year_matches).most_common(1)[0][0]
             return int(most_common_year)
         return 2024  # Default fallback
@@ -253,13 +366,7 @@ class GenericParser(BaseStatementParser):
 
     def _extract_account_number(self, text: str) -> Optional[str]:
         """Extract account number using generic patterns"""
-        account_patterns = [
-            re.compile(r'account\s+(?:number|#):?\s*[*\-x]*(\d{4,5})', re.IGNORECASE),
-            re.compile(r'acct\s+(?:number|#):?\s*[*\-x]*(\d{4,5})', re.IGNORECASE),
-            re.compile(r'ending\s+in:?\s*(\d{4,5})', re.IGNORECASE),
-        ]
-
-        for pattern in account_patterns:
+        for pattern in self.account_patterns:
             match = pattern.search(text)
             if match:
                 return f"****{match.group(1)}"
@@ -267,29 +374,7 @@ class GenericParser(BaseStatementParser):
 
     def _should_ignore_line(self, line: str) -> bool:
         """Generic line filtering"""
-        generic_ignore_patterns = [
-            r'^Page\s+\d+',
-            r'^Statement\s+Date',
-            r'^Account\s+Number',
-            r'^Payment\s+Due',
-            r'^Previous\s+Balance',
-            r'^New\s+Balance',
-            r'^Total\s+',
-            r'^Summary',
-            r'^Customer\s+Service',
-            r'^Questions\?',
-            r'^Visit\s+us',
-            r'^Call\s+us',
-            r'^www\.',
-            r'^http',
-            r'^\d+\s*$',  # Just numbers
-            r'^-+\s*$',   # Just dashes
-            r'^=+\s*$',   # Just equals
-            r'^\s*$',     # Empty lines
-        ]
-
-        for pattern in generic_ignore_patterns:
-            if re.match(pattern, line, re.IGNORECASE):
-                return True
+        if self.generic_ignore_pattern.match(line):
+            return True
 
-        return super()._should_ignore_line(line)
\ No newline at end of file
+        return super()._should_ignore_line(line)
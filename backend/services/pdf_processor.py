@@ -1,11 +1,16 @@
 """
 Core PDF processing service for credit card statements.
 """
-import pdfplumber
+import pymupdf
+import asyncio
 import logging
+import math
+import multiprocessing
+import os
 import re
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing import shared_memory
 from typing import Optional, List, Dict, Any, Tuple
-from io import BytesIO
 from datetime import datetime
 
 try:
@@ -16,7 +21,7 @@ try:
         BankType,
         ParsingConfig
     )
-    from .bank_detection import BankDetector
+    from .bank_detection import BANK_DETECTOR
     from .bank_parsers import get_parser_for_bank
 except ImportError:
     # Fallback for when running as script
@@ -27,25 +32,175 @@ except ImportError:
         BankType,
         ParsingConfig
     )
-    from services.bank_detection import BankDetector
+    from services.bank_detection import BANK_DETECTOR
     from services.bank_parsers import get_parser_for_bank
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Worker pool sizing for page-level extraction
+MAX_WORKERS = min(os.cpu_count() or 1, 8)
+
+# Workers are started from a clean server process rather than forked from the
+# threaded event-loop process; forkserver is unavailable on Windows
+WORKER_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+# Documents shorter than this are extracted inline; pool dispatch costs more than it saves
+PARALLEL_PAGE_THRESHOLD = 8
+
+# Every PDF starts with this header and ends its trailer with an %%EOF marker
+PDF_SIGNATURE = b'%PDF-'
+PDF_EOF_MARKER = b'%%EOF'
+PDF_TRAILER_SCAN_BYTES = 1024
+
 
 class PDFProcessingError(Exception):
     """Custom exception for PDF processing errors"""
-    pass
+
+    def __init__(self, message: str, errors: Optional[List[str]] = None):
+        super().__init__(message)
+        # User-facing error details; None means report the message itself
+        self.errors = errors
+
+
+def create_worker_pool(max_workers: int = MAX_WORKERS) -> ProcessPoolExecutor:
+    """
+    Create the process pool used for parallel page extraction.
+
+    Args:
+        max_workers: Number of worker processes
+
+    Returns:
+        ProcessPoolExecutor to hand to PDFProcessor
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context(WORKER_START_METHOD)
+    )
+
+
+def _open_document(pdf_content: bytes) -> "pymupdf.Document":
+    """Open PDF bytes or a memoryview with PyMuPDF; callers must close() the document"""
+    return pymupdf.open(stream=pdf_content, filetype="pdf")
+
+
+def _extract_page_text(page, page_num: int) -> str:
+    """Extract text from a single PyMuPDF page, falling back to its tables"""
+    page_text = page.get_text("text").rstrip()
+    if page_text:
+        return f"--- Page {page_num} ---\n{page_text}\n\n"
+
+    # Try extracting from tables if regular text extraction fails
+    tables = page.find_tables().tables
+    if not tables:
+        return ""
+
+    # Rows are collected and joined once; += would recopy the text per row
+    parts = []
+    for table in tables:
+        for row in table.extract():
+            if row and any(cell for cell in row if cell):
+                parts.append(" | ".join(str(cell) if cell else "" for cell in row))
+                parts.append("\n")
+    parts.append("\n")
+    return "".join(parts)
+
+
+def _extract_page_range(pdf_content: bytes, first: int, last: int) -> List[Tuple[int, str]]:
+    """
+    Extract text for pages [first, last) of a PDF.
+
+    Runs inside a pool worker, so it takes the raw (picklable) bytes and
+    opens its own document handle.
+
+    Args:
+        pdf_content: Raw PDF bytes
+        first: Zero-based index of the first page to extract
+        last: Zero-based index one past the last page to extract
+
+    Returns:
+        List of (page_num, page_text) tuples in page order
+    """
+    results = []
+    doc = _open_document(pdf_content)
+    try:
+        for index in range(first, last):
+            page_num = index + 1
+            try:
+                results.append((page_num, _extract_page_text(doc.load_page(index), page_num)))
+            except Exception as e:
+                logger.warning(f"Failed to extract text from page {page_num}: {str(e)}")
+    finally:
+        doc.close()
+    return results
+
+
+def _extract_shared_page_range(shm_name: str, size: int, first: int, last: int) -> List[Tuple[int, str]]:
+    """
+    Pool worker entry point that reads the PDF from a shared memory block.
+
+    Only the block name crosses the process boundary; PyMuPDF opens the
+    document directly on the shared buffer without copying it.
+
+    Args:
+        shm_name: Name of the SharedMemory block holding the PDF
+        size: Length of the PDF in bytes (blocks may be rounded up)
+        first: Zero-based index of the first page to extract
+        last: Zero-based index one past the last page to extract
+
+    Returns:
+        List of (page_num, page_text) tuples in page order
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        view = shm.buf[:size]
+        try:
+            return _extract_page_range(view, first, last)
+        finally:
+            view.release()
+    finally:
+        shm.close()
+
+
+def _build_warmup_pdf() -> bytes:
+    """Render a one-page PDF with a line of statement-like text"""
+    doc = pymupdf.open()
+    try:
+        page = doc.new_page()
+        page.insert_text((72, 72), "Chase Card Services 01/15 STARBUCKS STORE 5.67")
+        return doc.tobytes()
+    finally:
+        doc.close()
+
+
+def warm_up() -> None:
+    """
+    Exercise PyMuPDF and the detection regexes once before serving traffic.
+
+    The first document open and the first match against each compiled
+    pattern pay one-off initialization costs; running them at startup
+    keeps that latency out of the first upload and fails fast if a
+    native dependency is broken.
+    """
+    pdf_content = _build_warmup_pdf()
+    doc = _open_document(pdf_content)
+    try:
+        sample_text = _extract_page_text(doc.load_page(0), 1)
+    finally:
+        doc.close()
+
+    BANK_DETECTOR.detect_bank(sample_text)
 
 
 class PDFProcessor:
     """Main PDF processor for credit card statements"""
 
-    def __init__(self):
-        self.bank_detector = BankDetector()
+    def __init__(self, executor: Optional[Executor] = None):
+        self.bank_detector = BANK_DETECTOR
         self.config = ParsingConfig()
+        # Long-lived worker pool for page extraction; owned by the application lifespan
+        self.executor = executor
 
     async def process_pdf(self, pdf_content: bytes, filename: str = None) -> ProcessingResult:
         """
@@ -59,46 +214,13 @@ class PDFProcessor:
             ProcessingResult containing success/failure status and data
         """
         try:
-            # Extract text from PDF
-            extracted_text, page_count = await self._extract_text_from_pdf(pdf_content)
-
-            if not extracted_text.strip():
-                return ProcessingResult.error_response(
-                    "Unable to extract text from PDF",
-                    ["PDF appears to be empty or contains only images"]
-                )
-
-            # Detect bank type
-            bank_type = self.bank_detector.detect_bank(extracted_text)
-            logger.info(f"Detected bank type: {bank_type}")
-
-            # Get appropriate parser
-            parser = get_parser_for_bank(bank_type)
-            if not parser:
-                return ProcessingResult.error_response(
-                    f"No parser available for bank type: {bank_type}",
-                    ["Unsupported bank format detected"]
-                )
-
-            # Parse the statement
-            statement = parser.parse_statement(extracted_text, filename)
-
-            if not statement.transactions:
-                return ProcessingResult.error_response(
-                    "No transactions found in the statement",
-                    ["Statement may be in an unsupported format or corrupted"]
-                )
-
-            # Update metadata
-            statement.metadata.total_transactions = len(statement.transactions)
-            statement.raw_text = extracted_text
-
-            logger.info(f"Successfully processed {len(statement.transactions)} transactions")
-
+            statement = await self.parse_pdf(pdf_content, filename)
             return ProcessingResult.success_response(statement)
 
         except PDFProcessingError as e:
             logger.error(f"PDF processing error: {str(e)}")
+            if e.errors is not None:
+                return ProcessingResult.error_response(str(e), e.errors)
             return ProcessingResult.error_response(
                 "Failed to process PDF",
                 [str(e)]
@@ -110,9 +232,65 @@ class PDFProcessor:
                 [f"Internal error: {type(e).__name__}"]
             )
 
+    async def parse_pdf(self, pdf_content: bytes, filename: str = None) -> ProcessedStatement:
+        """
+        Extract and parse a PDF into a ProcessedStatement.
+
+        Args:
+            pdf_content: Raw PDF bytes
+            filename: Original filename for context
+
+        Returns:
+            ProcessedStatement with at least one transaction
+
+        Raises:
+            PDFProcessingError: If the PDF cannot be turned into transactions
+        """
+        # Extract text from PDF
+        extracted_text, page_count = await self._extract_text_from_pdf(pdf_content)
+
+        if not extracted_text.strip():
+            raise PDFProcessingError(
+                "Unable to extract text from PDF",
+                ["PDF appears to be empty or contains only images"]
+            )
+
+        # Detect bank type
+        bank_type = self.bank_detector.detect_bank(extracted_text)
+        logger.info(f"Detected bank type: {bank_type}")
+
+        # Get appropriate parser
+        parser = get_parser_for_bank(bank_type)
+        if not parser:
+            raise PDFProcessingError(
+                f"No parser available for bank type: {bank_type}",
+                ["Unsupported bank format detected"]
+            )
+
+        # Parse the statement; re-processing the same text reuses the earlier parse
+        statement = parser.parse_statement_cached(extracted_text, filename)
+
+        if not statement.transactions:
+            raise PDFProcessingError(
+                "No transactions found in the statement",
+                ["Statement may be in an unsupported format or corrupted"]
+            )
+
+        # Update metadata
+        statement.metadata.total_transactions = len(statement.transactions)
+
+        logger.info(f"Successfully processed {len(statement.transactions)} transactions")
+
+        return statement
+
     async def _extract_text_from_pdf(self, pdf_content: bytes) -> Tuple[str, int]:
         """
-        Extract text from PDF using pdfplumber.
+        Extract text from PDF using PyMuPDF.
+
+        Long documents are split into page ranges and extracted in the
+        worker pool when one is configured. The pool holds processes, not
+        threads: PyMuPDF is not thread-safe and keeps the GIL while it
+        extracts, so pages in threads would serialize or corrupt state.
 
         Args:
             pdf_content: Raw PDF bytes
@@ -121,33 +299,30 @@ class PDFProcessor:
             Tuple of (extracted_text, page_count)
         """
         try:
-            pdf_file = BytesIO(pdf_content)
-            extracted_text = ""
-            page_count = 0
-
-            with pdfplumber.open(pdf_file) as pdf:
-                page_count = len(pdf.pages)
+            doc = _open_document(pdf_content)
+            try:
+                page_count = doc.page_count
 
                 if page_count == 0:
                     raise PDFProcessingError("PDF contains no pages")
 
-                for page_num, page in enumerate(pdf.pages, 1):
-                    try:
-                        page_text = page.extract_text()
-                        if page_text:
-                            extracted_text += f"--- Page {page_num} ---\n{page_text}\n\n"
-                        else:
-                            # Try extracting from tables if regular text extraction fails
-                            tables = page.extract_tables()
-                            if tables:
-                                for table in tables:
-                                    for row in table:
-                                        if row and any(cell for cell in row if cell):
-                                            extracted_text += " | ".join(str(cell) if cell else "" for cell in row) + "\n"
-                                extracted_text += "\n"
-                    except Exception as e:
-                        logger.warning(f"Failed to extract text from page {page_num}: {str(e)}")
-                        continue
+                use_pool = self.executor is not None and page_count >= PARALLEL_PAGE_THRESHOLD
+                if not use_pool:
+                    page_texts = []
+                    for page_num, page in enumerate(doc, 1):
+                        try:
+                            page_texts.append((page_num, _extract_page_text(page, page_num)))
+                        except Exception as e:
+                            logger.warning(f"Failed to extract text from page {page_num}: {str(e)}")
+                            continue
+            finally:
+                # Release the C-side document memory as soon as extraction is done
+                doc.close()
+
+            if use_pool:
+                page_texts = await self._extract_pages_parallel(pdf_content, page_count)
+
+            extracted_text = "".join(text for _, text in page_texts)
 
             if not extracted_text.strip():
                 raise PDFProcessingError("No text could be extracted from the PDF")
@@ -159,6 +334,46 @@ class PDFProcessor:
                 raise
             raise PDFProcessingError(f"Failed to process PDF file: {str(e)}")
 
+    async def _extract_pages_parallel(self, pdf_content: bytes, page_count: int) -> List[Tuple[int, str]]:
+        """
+        Fan page ranges out to the worker pool and merge the results in page order.
+
+        Args:
+            pdf_content: Raw PDF bytes or a memoryview of them
+            page_count: Total number of pages in the document
+
+        Returns:
+            List of (page_num, page_text) tuples in page order
+        """
+        loop = asyncio.get_running_loop()
+        chunk_size = math.ceil(page_count / MAX_WORKERS)
+        size = len(pdf_content)
+
+        # Copy the PDF into shared memory once instead of pickling it to every worker
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        try:
+            shm.buf[:size] = pdf_content
+
+            futures = [
+                loop.run_in_executor(
+                    self.executor,
+                    _extract_shared_page_range,
+                    shm.name,
+                    size,
+                    first,
+                    min(first + chunk_size, page_count)
+                )
+                for first in range(0, page_count, chunk_size)
+            ]
+
+            page_texts = []
+            for chunk in await asyncio.gather(*futures):
+                page_texts.extend(chunk)
+            return page_texts
+        finally:
+            shm.close()
+            shm.unlink()
+
     def validate_pdf_content(self, content: bytes, max_size_mb: int = 50) -> Tuple[bool, Optional[str]]:
         """
         Validate PDF content before processing.
@@ -176,13 +391,17 @@ class PDFProcessor:
             return False, f"File size ({size_mb:.1f}MB) exceeds maximum allowed size ({max_size_mb}MB)"
 
         # Check for PDF signature
-        if not content.startswith(b'%PDF-'):
+        if content[:len(PDF_SIGNATURE)] != PDF_SIGNATURE:
             return False, "File does not appear to be a valid PDF"
 
         # Check minimum size
         if len(content) < 1024:  # 1KB minimum
             return False, "PDF file appears to be too small or corrupted"
 
+        # Check the trailer survived the upload
+        if PDF_EOF_MARKER not in bytes(content[-PDF_TRAILER_SCAN_BYTES:]):
+            return False, "PDF file appears to be truncated or corrupted"
+
         return True, None
 
     async def get_processing_stats(self, result: ProcessingResult) -> Dict[str, Any]:
@@ -2,8 +2,13 @@
 Basic test script to validate the PDF processing implementation.
 """
 import asyncio
+import logging
+import mmap
 import sys
 import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 
 # Add the backend directory to Python path
@@ -15,10 +20,15 @@ os.environ['PYTHONPATH'] = backend_dir
 
 try:
     from models.statement_data import Transaction, TransactionType, BankType, StatementMetadata, ProcessedStatement
-    from services.pdf_processor import PDFProcessor
+    from services.pdf_processor import PDFProcessor, PARALLEL_PAGE_THRESHOLD
     from services.bank_detection import BankDetector
     from services.bank_parsers import get_parser_for_bank, get_supported_banks
     from utils.data_cleaner import DataCleaner
+    from utils import cache as cache_module
+    from utils import keyword_matcher
+    from utils.cache import LRUCache, content_digest
+    from utils.keyword_matcher import KeywordMatcher
+    from utils.logger import BufferedFileHandler, setup_logging
 except ImportError as e:
     print(f"Import error: {e}")
     print("Trying alternative import method...")
@@ -219,6 +229,297 @@ TRANSACTIONS:
     print("✅ Sample statement processing test passed\n")
 
 
+def test_bank_detection_overlapping_matches():
+    """Test detection when banks' patterns overlap or only secondary indicators match"""
+    print("Testing bank detection edge cases...")
+
+    detector = BankDetector()
+
+    # Every bank is scored, even when its hits overlap another bank's
+    detected = detector.detect_bank("discover bank of america statement " * 4)
+    print(f"Discover/Bank of America overlap: {detected}")
+    assert detected == BankType.BANK_OF_AMERICA
+
+    detected = detector.detect_bank("nacion bank of america " * 4)
+    print(f"Nación/Bank of America overlap: {detected}")
+    assert detected == BankType.BANK_OF_AMERICA
+
+    # Secondary indicators alone still count towards a bank
+    detected = detector.detect_bank("platinum card gold card green card pay over time", 0.4)
+    print(f"Secondary indicators only: {detected}")
+    assert detected == BankType.AMEX
+
+    # Case-insensitive matching also folds letters that lower() leaves alone
+    detected = detector.detect_bank("DIſCOVER CARD " * 4)
+    print(f"Long s detection: {detected}")
+    assert detected == BankType.DISCOVER
+
+    print("✅ Bank detection edge cases test passed\n")
+
+
+def test_lru_cache():
+    """Test LRU cache eviction order"""
+    print("Testing LRU cache...")
+
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    # Reading "a" makes "b" the least recently used entry
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    print(f"Cache size after eviction: {len(cache)}")
+    assert len(cache) == 2
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert cache.get("b", "missing") == "missing"
+
+    cache.clear()
+    assert len(cache) == 0
+
+    print("✅ LRU cache test passed\n")
+
+
+def test_content_digest():
+    """Test upload digests with and without the BLAKE3 backend"""
+    print("Testing content digest...")
+
+    content = b"%PDF-1.4\n" + bytes(range(256)) * 64
+    blake3_backend = cache_module.blake3
+    try:
+        digests = [content_digest(content), content_digest(memoryview(content))]
+        cache_module.blake3 = None
+        digests += [content_digest(content), content_digest(memoryview(content))]
+    finally:
+        cache_module.blake3 = blake3_backend
+    print(f"BLAKE3 available: {blake3_backend is not None}")
+
+    # Bytes and memoryviews of the same upload share a key under either backend
+    assert digests[0] == digests[1] and len(digests[0]) == 32
+    assert digests[2] == digests[3] and len(digests[2]) == 32
+    assert content_digest(content + b"x") != digests[0]
+
+    print("✅ Content digest test passed\n")
+
+
+def test_parse_statement_cached():
+    """Test that cached parses hand out independent statements"""
+    print("Testing cached statement parsing...")
+
+    sample_text = """
+CHASE CREDIT CARD STATEMENT
+Statement Date: 01/15/2024
+01/02 STARBUCKS STORE #1234           5.67
+01/05 AMAZON.COM*ABCD1234            29.99
+    """
+
+    parser = get_parser_for_bank(BankType.CHASE)
+    parser.cache_clear()
+    try:
+        first = parser.parse_statement_cached(sample_text, "cached.pdf")
+        transaction_count = len(first.transactions)
+        print(f"Parsed {transaction_count} transactions")
+        assert transaction_count > 0
+        assert first.raw_text is None
+
+        # Changes to one result must not leak into the cached statement
+        first.transactions.clear()
+        first.metadata.total_transactions = -1
+        first.processing_notes.append("changed by caller")
+
+        second = parser.parse_statement_cached(sample_text, "cached.pdf")
+        assert len(second.transactions) == transaction_count
+        assert second.metadata.total_transactions != -1
+        assert "changed by caller" not in second.processing_notes
+
+        kept = parser.parse_statement_cached(sample_text, "cached.pdf", keep_raw_text=True)
+        assert kept.raw_text == sample_text
+    finally:
+        parser.cache_clear()
+
+    print("✅ Cached statement parsing test passed\n")
+
+
+def test_keyword_matcher():
+    """Test keyword matching with and without the Aho-Corasick backend"""
+    print("Testing keyword matcher...")
+
+    keywords = [("FEE", "fee"), ("ANNUAL FEE", "annual"), ("PAYMENT", "payment")]
+    automaton_backend = keyword_matcher.ahocorasick
+    matchers = [KeywordMatcher(keywords)]
+    try:
+        keyword_matcher.ahocorasick = None
+        matchers.append(KeywordMatcher(keywords))
+    finally:
+        keyword_matcher.ahocorasick = automaton_backend
+    print(f"Aho-Corasick available: {keyword_matcher.AHOCORASICK_AVAILABLE}")
+
+    for matcher in matchers:
+        assert matcher.search("LATE FEE")
+        assert not matcher.search("late fee")
+        # Overlapping keywords are all reported
+        assert matcher.values("ANNUAL FEE PAYMENT") == {"fee", "annual", "payment"}
+        assert matcher.first_value("ANNUAL FEE", ("annual", "fee")) == "annual"
+        assert matcher.first_value("GROCERIES", ("annual", "fee")) is None
+
+    print("✅ Keyword matcher test passed\n")
+
+
+def _build_sample_pdf(page_count: int) -> bytes:
+    """Build a PDF with one line of text per page"""
+    import pymupdf
+
+    doc = pymupdf.open()
+    try:
+        for page_num in range(1, page_count + 1):
+            page = doc.new_page()
+            page.insert_text((72, 72), f"Statement page {page_num}")
+        return doc.tobytes()
+    finally:
+        doc.close()
+
+
+def test_shared_memory_extraction():
+    """Test that pool extraction through shared memory matches inline extraction"""
+    print("Testing shared memory page extraction...")
+
+    pdf_content = _build_sample_pdf(PARALLEL_PAGE_THRESHOLD)
+
+    inline_text, _ = asyncio.run(PDFProcessor()._extract_text_from_pdf(pdf_content))
+    # One worker thread keeps PyMuPDF single-threaded while still going through shared memory
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pooled_text, page_count = asyncio.run(
+            PDFProcessor(executor=executor)._extract_text_from_pdf(pdf_content)
+        )
+
+    print(f"Extracted {page_count} pages through the pool")
+    assert page_count == PARALLEL_PAGE_THRESHOLD
+    assert pooled_text == inline_text
+    assert f"Statement page {PARALLEL_PAGE_THRESHOLD}" in pooled_text
+
+    print("✅ Shared memory page extraction test passed\n")
+
+
+def test_mmap_upload():
+    """Test mapping spooled uploads and releasing them again"""
+    print("Testing memory-mapped uploads...")
+
+    import main
+    from starlette.datastructures import UploadFile
+
+    pdf_content = _build_sample_pdf(1)
+    for payload, mapped in ((pdf_content, True), (b"", False)):
+        with tempfile.SpooledTemporaryFile(max_size=1024 * 1024) as spooled:
+            spooled.write(payload)
+            upload = UploadFile(file=spooled, filename="statement.pdf")
+
+            view = asyncio.run(main._map_upload(upload))
+            print(f"Mapped {len(view)} bytes, memory map: {isinstance(view.obj, mmap.mmap)}")
+            # Empty uploads cannot be mapped and fall back to a plain read
+            assert isinstance(view.obj, mmap.mmap) == mapped
+            assert view.tobytes() == payload
+            main._release_upload(view)
+
+    print("✅ Memory-mapped uploads test passed\n")
+
+
+def test_buffered_file_handler():
+    """Test when the buffered log file handler writes records out"""
+    print("Testing buffered file handler...")
+
+    test_logger = logging.getLogger("test_basic.buffered_file_handler")
+    test_logger.propagate = False
+    test_logger.setLevel(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        log_path = os.path.join(log_dir, "buffered.log")
+
+        def read_log() -> str:
+            with open(log_path, encoding="utf-8") as log_file:
+                return log_file.read()
+
+        handler = BufferedFileHandler(log_path, flush_interval=0)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        test_logger.addHandler(handler)
+        try:
+            # Records below flush_level wait in the buffer
+            test_logger.info("buffered record")
+            assert read_log() == ""
+
+            # An error flushes everything written so far
+            test_logger.error("error record")
+            assert read_log() == "buffered record\nerror record\n"
+
+            test_logger.info("tail record")
+        finally:
+            test_logger.removeHandler(handler)
+            handler.close()
+        assert read_log().endswith("tail record\n")
+
+        # The idle flush thread catches up without an error or close()
+        handler = BufferedFileHandler(log_path, flush_interval=0.05)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        test_logger.addHandler(handler)
+        try:
+            test_logger.info("idle record")
+            deadline = time.monotonic() + 5
+            while "idle record" not in read_log() and time.monotonic() < deadline:
+                time.sleep(0.05)
+            assert read_log().endswith("idle record\n")
+        finally:
+            test_logger.removeHandler(handler)
+            handler.close()
+
+    print("✅ Buffered file handler test passed\n")
+
+
+def test_logging_queue_listener():
+    """Test the queue listener lifecycle managed by setup_logging"""
+    print("Testing logging queue listener...")
+
+    from utils import logger as logger_module
+
+    root_logger = logging.getLogger()
+    saved_handlers = root_logger.handlers[:]
+    saved_level = root_logger.level
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        log_path = os.path.join(log_dir, "app.log")
+        try:
+            setup_logging("INFO", log_path, enable_colors=False)
+            listener = logger_module._queue_listener
+            assert listener is not None
+            assert root_logger.handlers == [logger_module._queue_handler]
+
+            # Repeat calls with the same settings keep the running listener
+            setup_logging("INFO", log_path, enable_colors=False)
+            assert logger_module._queue_listener is listener
+
+            logging.getLogger("test_basic.queue_listener").warning("queued record")
+
+            # Reconfiguring drains and stops the old listener and closes its file
+            setup_logging("INFO", None, enable_colors=False)
+            assert logger_module._queue_listener is not listener
+            with open(log_path, encoding="utf-8") as log_file:
+                assert "queued record" in log_file.read()
+        finally:
+            root_logger.removeHandler(logger_module._queue_handler)
+            listener = logger_module._queue_listener
+            handlers = listener.handlers if listener is not None else ()
+            logger_module._stop_queue_listener()
+            for handler in handlers:
+                handler.close()
+            logger_module._queue_handler = None
+            logger_module._configured_with = None
+            for handler in saved_handlers:
+                root_logger.addHandler(handler)
+            root_logger.setLevel(saved_level)
+
+    assert logger_module._queue_listener is None
+
+    print("✅ Logging queue listener test passed\n")
+
+
 async def main():
     """Run all tests"""
     print("🚀 Starting PDF Processing Implementation Tests\n")
@@ -231,6 +532,15 @@ async def main():
         test_data_cleaner()
         await test_pdf_processor()
         test_sample_statement_processing()
+        test_bank_detection_overlapping_matches()
+        test_lru_cache()
+        test_content_digest()
+        test_parse_statement_cached()
+        test_keyword_matcher()
+        test_shared_memory_extraction()
+        test_mmap_upload()
+        test_buffered_file_handler()
+        test_logging_queue_listener()
 
         print("🎉 All tests passed successfully!")
         print("\n📋 Implementation Summary:")
@@ -0,0 +1,84 @@
+"""
+Small bounded caches for repeat-work elimination.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable
+
+try:
+    import blake3
+except ImportError:
+    # blake3 is optional; hashlib's BLAKE2b is the fallback
+    blake3 = None
+
+
+class LRUCache:
+    """Thread-safe least-recently-used cache with a fixed capacity"""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, marking it as recently used"""
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return default
+            return self._data[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full"""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries"""
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+def text_digest(text: str) -> bytes:
+    """
+    Compute a compact cache key for a text blob.
+
+    Args:
+        text: Text to hash
+
+    Returns:
+        16-byte BLAKE2b digest
+    """
+    return hashlib.blake2b(text.encode("utf-8", "ignore"), digest_size=16).digest()
+
+
+def content_digest(content: bytes) -> bytes:
+    """
+    Compute a cache key for raw file content.
+
+    BLAKE3 hashes large inputs with SIMD and multiple threads, which
+    matters for uploads of tens of MB; BLAKE2b is used when it is not
+    installed.
+
+    Args:
+        content: Raw bytes or a memoryview (e.g. an uploaded PDF)
+
+    Returns:
+        32-byte BLAKE3 or BLAKE2b digest
+    """
+    if blake3 is not None:
+        return blake3.blake3(content, max_threads=blake3.blake3.AUTO).digest()
+    return hashlib.blake2b(content, digest_size=32).digest()
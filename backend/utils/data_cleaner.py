@@ -2,23 +2,140 @@
 Data cleaning and standardization utilities for credit card statements.
 """
 import re
-from datetime import datetime, date
-from typing import List, Optional, Tuple, Dict, Any
+import sys
+import time
+from datetime import date
+from functools import lru_cache
+from typing import Iterable, List, Optional, Sequence, Set, Tuple, Dict, Any
 from decimal import Decimal, InvalidOperation
 import logging
 
 try:
     from ..models import Transaction, ProcessedStatement
+    from .cache import LRUCache
+    from .keyword_matcher import KeywordMatcher
 except ImportError:
     from models.statement_data import Transaction, ProcessedStatement
+    from utils.cache import LRUCache
+    from utils.keyword_matcher import KeywordMatcher
 
 logger = logging.getLogger(__name__)
 
+# Amounts below this fit Decimal's default 28-digit precision with two
+# decimals to spare, so quantizing them can never fail
+_DECIMAL_SAFE_LIMIT = 1e15
+
+# Below this many amounts clean_amounts skips numpy's array setup cost
+NUMPY_AMOUNT_THRESHOLD = 500
+
+# Words kept upper-case in cleaned descriptions
+_COMMON_ABBREVIATIONS = frozenset({'ATM', 'POS', 'ACH', 'API', 'LLC', 'INC', 'USA', 'US'})
+
+_STATE_ABBREVIATIONS = frozenset({
+    'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
+    'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
+    'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
+    'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
+    'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY'
+})
+
+_REGEX_SYNTAX = frozenset('\\.^$*+?{}[]()|')
+_REGEX_QUANTIFIERS = frozenset('*?{')
+
+
+@lru_cache(maxsize=None)
+def _literal_anchors(pattern: str) -> Optional[Tuple[str, ...]]:
+    """
+    Return lower-case text that every match of pattern starts with, one
+    per top-level alternative, or None if some alternative has none.
+    """
+    if '(' in pattern or '[' in pattern or '\\|' in pattern:
+        return None
+
+    anchors = []
+    for alternative in pattern.split('|'):
+        prefix = []
+        for char in alternative:
+            if char in _REGEX_SYNTAX:
+                # A quantifier makes the character before it optional
+                if char in _REGEX_QUANTIFIERS and prefix:
+                    prefix.pop()
+                break
+            prefix.append(char)
+        if not prefix:
+            return None
+        anchors.append(''.join(prefix).lower())
+    return tuple(anchors)
+
+
+class _PatternPrefilter:
+    """
+    Narrows a table of case-insensitive patterns to those that can match.
+
+    Each pattern's literal prefixes go into one KeywordMatcher, so a
+    description is scanned once for every keyword instead of once per
+    regex. Candidates come back in table order, letting callers walk
+    only them rather than test every entry. Only ASCII text is filtered:
+    re.IGNORECASE lets a few non-ASCII letters (such as the long s) match
+    ASCII ones, and lower() does not.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[re.Pattern, Any]]):
+        """
+        Args:
+            entries: (pattern, key) pairs; several patterns may share a key
+        """
+        keys_by_anchor: Dict[str, Set[Any]] = {}
+        self._unanchored: Set[Any] = set()
+        self._order: Dict[Any, int] = {}
+
+        for pattern, key in entries:
+            self._order.setdefault(key, len(self._order))
+            anchors = _literal_anchors(pattern.pattern)
+            if anchors is None:
+                self._unanchored.add(key)
+                continue
+            for anchor in anchors:
+                keys_by_anchor.setdefault(anchor, set()).add(key)
+
+        self._matcher = KeywordMatcher(
+            (anchor, frozenset(keys)) for anchor, keys in keys_by_anchor.items()
+        )
+
+    def candidates(self, text: str) -> Optional[List[Any]]:
+        """Return the keys whose patterns may match text in table order, or None if all may"""
+        if not text.isascii():
+            return None
+        candidates = set(self._unanchored)
+        for keys in self._matcher.values(text.lower()):
+            candidates |= keys
+        if len(candidates) < 2:
+            return list(candidates)
+        return sorted(candidates, key=self._order.__getitem__)
+
 
 class DataCleaner:
     """Utility class for cleaning and standardizing transaction data"""
 
     def __init__(self):
+        # Cleaning results by raw description; see _clean_description_cached
+        self._description_cache = LRUCache(maxsize=4096)
+
+        # Date bounds for is_valid_date and the local-time span they hold for
+        self._refresh_date_bounds()
+
+        # Noise removed from descriptions, in order. Each pass sees the output
+        # of the one before, so only the two end-anchored patterns share a
+        # pass; leading and trailing spaces go when the words are split.
+        self.description_noise_patterns = (
+            # Date prefix or trailing year
+            re.compile(r'^\d{2}/\d{2}\s*|\s*\d{4}\s*$'),
+            # Reference numbers with # or *
+            re.compile(r'[#*]+\d*'),
+            # Embedded amounts
+            re.compile(r'\s*\$\d+\.?\d*\s*'),
+        )
+
         # Common merchant name standardizations
         self.merchant_standardizations = {
             # Gas stations
@@ -61,6 +178,12 @@ class DataCleaner:
             for pattern, replacement in self.merchant_standardizations.items()
         }
 
+        # Keyword prefilters over the tables above, so each description is
+        # scanned once before any of their regexes run
+        self._merchant_prefilter = _PatternPrefilter(
+            (pattern, pattern) for pattern in self.merchant_patterns
+        )
+
         # Category mapping based on merchant patterns
         self.category_patterns = {
             'Gas': [
@@ -97,6 +220,12 @@ class DataCleaner:
             ]
         }
 
+        self._category_prefilter = _PatternPrefilter(
+            (pattern, category)
+            for category, patterns in self.category_patterns.items()
+            for pattern in patterns
+        )
+
     def clean_statement(self, statement: ProcessedStatement) -> ProcessedStatement:
         """
         Clean and standardize an entire statement.
@@ -107,12 +236,11 @@ class DataCleaner:
         Returns:
             Cleaned statement with standardized data
         """
-        cleaned_transactions = []
-
-        for transaction in statement.transactions:
-            cleaned_transaction = self.clean_transaction(transaction)
-            if cleaned_transaction:  # Only include valid transactions
-                cleaned_transactions.append(cleaned_transaction)
+        # Only include valid transactions
+        cleaned_transactions = [
+            cleaned for cleaned in map(self.clean_transaction, statement.transactions)
+            if cleaned is not None
+        ]
 
         # Update the statement with cleaned transactions
         statement.transactions = cleaned_transactions
@@ -135,24 +263,20 @@ class DataCleaner:
             Cleaned transaction or None if invalid
         """
         try:
-            # Clean description
-            cleaned_description = self.clean_description(transaction.description)
-            if not cleaned_description.strip():
-                logger.warning(f"Transaction with empty description after cleaning: {transaction}")
+            standardized_description, auto_category = self._clean_description_cached(transaction.description)
+            if standardized_description is None:
+                logger.warning("Transaction with empty description after cleaning: %s", transaction)
                 return None
 
-            # Standardize merchant name
-            standardized_description = self.standardize_merchant_name(cleaned_description)
-
             # Auto-categorize if category is not set
-            category = transaction.category or self.auto_categorize(standardized_description)
+            category = transaction.category or auto_category
 
             # Validate and clean amount
             cleaned_amount = self.clean_amount(transaction.amount)
 
             # Validate date
             if not self.is_valid_date(transaction.date):
-                logger.warning(f"Invalid date in transaction: {transaction.date}")
+                logger.warning("Invalid date in transaction: %s", transaction.date)
                 return None
 
             return Transaction(
@@ -165,9 +289,36 @@ class DataCleaner:
             )
 
         except Exception as e:
-            logger.error(f"Error cleaning transaction: {e}")
+            logger.error("Error cleaning transaction: %s", e)
             return None
 
+    def _clean_description_cached(self, description: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Clean, standardize and categorize a raw description, reusing earlier results.
+
+        Statements repeat the same merchants many times, so each distinct
+        description pays for the regex work once.
+
+        Returns:
+            Tuple of (standardized_description, auto_category); the
+            description is None when nothing is left after cleaning
+        """
+        cached = self._description_cache.get(description)
+        if cached is not None:
+            return cached
+
+        cleaned_description = self.clean_description(description)
+        if not cleaned_description.strip():
+            result = (None, None)
+        else:
+            # Standardize merchant name; interned so every raw variant of a
+            # merchant shares one string across the statement
+            standardized_description = sys.intern(self.standardize_merchant_name(cleaned_description))
+            result = (standardized_description, self.auto_categorize(standardized_description))
+
+        self._description_cache.put(description, result)
+        return result
+
     def clean_description(self, description: str) -> str:
         """
         Clean transaction description.
@@ -181,33 +332,25 @@ class DataCleaner:
         if not description:
             return ""
 
-        # Remove extra whitespace
-        cleaned = re.sub(r'\s+', ' ', description.strip())
+        # Remove extra whitespace; split/join collapses exactly what \s+ does
+        cleaned = ' '.join(description.split())
 
         # Remove common noise patterns
-        noise_patterns = [
-            r'^\d{2}/\d{2}\s*',  # Remove date prefix
-            r'\s*\d{4}\s*$',     # Remove trailing year
-            r'[#*]+\d*',         # Remove reference numbers with # or *
-            r'\s*\$\d+\.?\d*\s*', # Remove embedded amounts
-            r'\s+$',             # Trailing spaces
-            r'^\s+',             # Leading spaces
-        ]
-
-        for pattern in noise_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
+        for pattern in self.description_noise_patterns:
+            cleaned = pattern.sub('', cleaned)
 
         # Normalize case - title case for most words, but preserve common abbreviations
         words = cleaned.split()
         normalized_words = []
 
         for word in words:
+            word_upper = word.upper()
             # Preserve common abbreviations in uppercase
-            if word.upper() in ['ATM', 'POS', 'ACH', 'API', 'LLC', 'INC', 'USA', 'US']:
-                normalized_words.append(word.upper())
+            if word_upper in _COMMON_ABBREVIATIONS:
+                normalized_words.append(word_upper)
             # Preserve state abbreviations
-            elif len(word) == 2 and word.upper() in self._get_state_abbreviations():
-                normalized_words.append(word.upper())
+            elif len(word) == 2 and word_upper in _STATE_ABBREVIATIONS:
+                normalized_words.append(word_upper)
             else:
                 # Title case for regular words
                 normalized_words.append(word.capitalize())
@@ -224,9 +367,12 @@ class DataCleaner:
         Returns:
             Description with standardized merchant name
         """
-        for pattern, replacement in self.merchant_patterns.items():
-            if pattern.search(description):
-                return pattern.sub(replacement, description)
+        candidates = self._merchant_prefilter.candidates(description)
+        for pattern in self.merchant_patterns if candidates is None else candidates:
+            # subn's count says whether it matched, so the text is scanned once
+            standardized, replaced = pattern.subn(self.merchant_patterns[pattern], description)
+            if replaced:
+                return standardized
 
         return description
 
@@ -240,8 +386,9 @@ class DataCleaner:
         Returns:
             Category name or None if no match
         """
-        for category, patterns in self.category_patterns.items():
-            for pattern in patterns:
+        candidates = self._category_prefilter.candidates(description)
+        for category in self.category_patterns if candidates is None else candidates:
+            for pattern in self.category_patterns[category]:
                 if pattern.search(description):
                     return category
 
@@ -257,6 +404,13 @@ class DataCleaner:
         Returns:
             Cleaned amount rounded to 2 decimal places
         """
+        # Amounts that already have at most two decimals, as every parsed
+        # Transaction amount does, come back unchanged from the Decimal path;
+        # the bound keeps out inf, NaN and values too long for its precision
+        if (type(amount) is float and -_DECIMAL_SAFE_LIMIT < amount < _DECIMAL_SAFE_LIMIT
+                and round(amount, 2) == amount):
+            return amount
+
         try:
             # Use Decimal for precise arithmetic
             decimal_amount = Decimal(str(amount))
@@ -264,9 +418,39 @@ class DataCleaner:
             cleaned = float(decimal_amount.quantize(Decimal('0.01')))
             return cleaned
         except (InvalidOperation, ValueError):
-            logger.warning(f"Invalid amount: {amount}, defaulting to 0.00")
+            logger.warning("Invalid amount: %s, defaulting to 0.00", amount)
             return 0.0
 
+    def clean_amounts(self, amounts: Sequence[float]) -> List[float]:
+        """
+        Clean many amounts at once; same results as clean_amount on each.
+
+        np.round cannot replace the Decimal rounding (it gives 2.67 for
+        2.675 where clean_amount gives 2.68), so numpy only picks out the
+        amounts that already have two decimals in one vectorized pass.
+        Those are returned as they are and the rest go through clean_amount.
+
+        Args:
+            amounts: Amounts to clean
+
+        Returns:
+            Cleaned amounts in input order
+        """
+        values = list(amounts)
+        if len(values) < NUMPY_AMOUNT_THRESHOLD or not all(type(amount) is float for amount in values):
+            return [self.clean_amount(amount) for amount in values]
+
+        import numpy as np
+
+        array = np.array(values, dtype=np.float64)
+        cleaned = array.tolist()
+        # inf and NaN overflow in np.round; the bound below excludes them anyway
+        with np.errstate(invalid='ignore', over='ignore'):
+            exact = (np.abs(array) < _DECIMAL_SAFE_LIMIT) & (np.round(array, 2) == array)
+        for index in np.flatnonzero(~exact).tolist():
+            cleaned[index] = self.clean_amount(values[index])
+        return cleaned
+
     def is_valid_date(self, transaction_date: date) -> bool:
         """
         Validate transaction date.
@@ -280,12 +464,21 @@ class DataCleaner:
         if not transaction_date:
             return False
 
-        # Check if date is reasonable (not too old or in future)
-        today = date.today()
-        min_date = date(today.year - 10, 1, 1)  # 10 years ago
-        max_date = date(today.year + 1, 12, 31)  # 1 year in future
+        # The bounds only move when the year changes; time.time() is far
+        # cheaper than date.today() to check that on every transaction
+        if not self._date_bounds_from <= time.time() < self._date_bounds_until:
+            self._refresh_date_bounds()
 
-        return min_date <= transaction_date <= max_date
+        return self._min_date <= transaction_date <= self._max_date
+
+    def _refresh_date_bounds(self):
+        """Recompute the reasonable-date range for the current year."""
+        year = date.today().year
+        # Check if date is reasonable (not too old or in future)
+        self._min_date = date(year - 10, 1, 1)  # 10 years ago
+        self._max_date = date(year + 1, 12, 31)  # 1 year in future
+        self._date_bounds_from = time.mktime((year, 1, 1, 0, 0, 0, 0, 0, -1))
+        self._date_bounds_until = time.mktime((year + 1, 1, 1, 0, 0, 0, 0, 0, -1))
 
     def deduplicate_transactions(self, transactions: List[Transaction]) -> List[Transaction]:
         """
@@ -299,20 +492,23 @@ class DataCleaner:
         """
         seen = set()
         unique_transactions = []
+        mark_seen = seen.add
+        keep = unique_transactions.append
 
         for transaction in transactions:
-            # Create a hash key from key fields
+            # Create a hash key from key fields; descriptions are still
+            # normalized here because callers may pass uncleaned transactions
             key = (
                 transaction.date,
                 transaction.description.strip().lower(),
                 abs(transaction.amount)  # Use absolute value to catch amount sign variations
             )
 
-            if key not in seen:
-                seen.add(key)
-                unique_transactions.append(transaction)
-            else:
-                logger.info(f"Duplicate transaction removed: {transaction.description}")
+            if key in seen:
+                logger.info("Duplicate transaction removed: %s", transaction.description)
+                continue
+            mark_seen(key)
+            keep(transaction)
 
         return unique_transactions
 
@@ -326,34 +522,39 @@ class DataCleaner:
         Returns:
             Dictionary with validation statistics
         """
-        stats = {
-            'total_transactions': len(transactions),
-            'valid_transactions': 0,
-            'invalid_dates': 0,
-            'zero_amounts': 0,
-            'empty_descriptions': 0,
-            'warnings': []
-        }
+        # Count in locals and store once; the loop runs per transaction
+        valid_transactions = invalid_dates = zero_amounts = empty_descriptions = 0
+        is_valid_date = self.is_valid_date
 
         for transaction in transactions:
             is_valid = True
 
             # Check date validity
-            if not self.is_valid_date(transaction.date):
-                stats['invalid_dates'] += 1
+            if not is_valid_date(transaction.date):
+                invalid_dates += 1
                 is_valid = False
 
             # Check for zero amounts
             if transaction.amount == 0:
-                stats['zero_amounts'] += 1
+                zero_amounts += 1
 
-            # Check for empty descriptions
-            if not transaction.description.strip():
-                stats['empty_descriptions'] += 1
+            # Check for empty descriptions; isspace() avoids the copy strip() makes
+            description = transaction.description
+            if not description or description.isspace():
+                empty_descriptions += 1
                 is_valid = False
 
             if is_valid:
-                stats['valid_transactions'] += 1
+                valid_transactions += 1
+
+        stats = {
+            'total_transactions': len(transactions),
+            'valid_transactions': valid_transactions,
+            'invalid_dates': invalid_dates,
+            'zero_amounts': zero_amounts,
+            'empty_descriptions': empty_descriptions,
+            'warnings': []
+        }
 
         # Generate warnings
         if stats['invalid_dates'] > 0:
@@ -367,12 +568,6 @@ class DataCleaner:
 
         return stats
 
-    def _get_state_abbreviations(self) -> set:
+    def _get_state_abbreviations(self) -> frozenset:
         """Get set of US state abbreviations"""
-        return {
-            'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
-            'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
-            'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
-            'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
-            'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY'
-        }
\ No newline at end of file
+        return _STATE_ABBREVIATIONS
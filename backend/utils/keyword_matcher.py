@@ -0,0 +1,73 @@
+"""
+Literal keyword matching with an optional Aho-Corasick backend.
+"""
+from typing import Any, Dict, Iterable, Optional, Sequence, Set, Tuple
+
+try:
+    import ahocorasick
+except ImportError:
+    # pyahocorasick is optional; substring scans give identical results
+    ahocorasick = None
+
+AHOCORASICK_AVAILABLE = ahocorasick is not None
+
+
+class KeywordMatcher:
+    """
+    Finds which of a fixed set of literal keywords occur in a text.
+
+    With pyahocorasick installed every keyword is matched in a single
+    pass over the text, however many keywords there are. Without it each
+    keyword is checked with a substring test. Both backends report
+    overlapping keywords, so results never depend on which one is used.
+
+    Matching is case-sensitive. Callers upper-case the text once and scan
+    that; one str.upper() plus a scan measured several times faster than
+    a chain of re.IGNORECASE searches over the original text.
+    """
+
+    def __init__(self, keywords: Iterable[Tuple[str, Any]]):
+        """
+        Args:
+            keywords: (keyword, value) pairs; a value may be shared by many
+                keywords, and a repeated keyword keeps its first value
+        """
+        self._keywords: Dict[str, Any] = {}
+        for keyword, value in keywords:
+            self._keywords.setdefault(keyword, value)
+        self._automaton = None
+
+        if ahocorasick is not None and self._keywords:
+            automaton = ahocorasick.Automaton()
+            for keyword, value in self._keywords.items():
+                automaton.add_word(keyword, value)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def search(self, text: str) -> bool:
+        """Return True if any keyword occurs in text"""
+        if self._automaton is not None:
+            for _ in self._automaton.iter(text):
+                return True
+            return False
+        return any(keyword in text for keyword in self._keywords)
+
+    def values(self, text: str) -> Set[Any]:
+        """Return the values of every keyword that occurs in text"""
+        if self._automaton is not None:
+            return {value for _, value in self._automaton.iter(text)}
+        return {value for keyword, value in self._keywords.items() if keyword in text}
+
+    def first_value(self, text: str, priority: Sequence[Any]) -> Optional[Any]:
+        """
+        Return the earliest value in priority that has a keyword in text.
+
+        This reproduces an if/elif chain of any(keyword in text ...) tests
+        with a single scan, whatever order the keywords appear in the text.
+        """
+        found = self.values(text)
+        if found:
+            for value in priority:
+                if value in found:
+                    return value
+        return None
@@ -1,12 +1,27 @@
 """
 Logging configuration and utilities.
 """
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
-from typing import Optional
-from datetime import datetime
+import threading
+import time
+from functools import wraps
+from typing import Optional, Tuple
 import os
 
+# Log file write buffer, and how often buffered records are flushed when idle
+FILE_LOG_BUFFER_SIZE = 64 * 1024
+FILE_LOG_FLUSH_INTERVAL = 0.5
+
+# Listener started by setup_logging; its thread runs the real handlers
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+# Root handler setup_logging installed and the settings it was built with
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+_configured_with: Optional[Tuple[int, Optional[str], bool]] = None
+
 
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with colors for different log levels"""
@@ -20,10 +35,102 @@ class ColoredFormatter(logging.Formatter):
     }
     RESET = '\033[0m'
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._colored_levelnames = {
+            levelname: f"{color}{levelname}{self.RESET}" for levelname, color in self.COLORS.items()
+        }
+
     def format(self, record):
-        log_color = self.COLORS.get(record.levelname, self.RESET)
-        record.levelname = f"{log_color}{record.levelname}{self.RESET}"
-        return super().format(record)
+        levelname = record.levelname
+        colored = self._colored_levelnames.get(levelname)
+        if colored is None:
+            colored = f"{self.RESET}{levelname}{self.RESET}"
+        # Other handlers format the same record, so restore the plain name afterwards
+        record.levelname = colored
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
+
+
+# Formatters are not modified after construction, so setup_logging shares these
+_DETAILED_FORMATTER = logging.Formatter(
+    fmt='%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+_SIMPLE_FORMATTER = logging.Formatter(
+    fmt='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%H:%M:%S'
+)
+
+_COLORED_FORMATTER = ColoredFormatter(
+    fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%H:%M:%S'
+)
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that lets the file's write buffer batch records.
+
+    StreamHandler.emit flushes after every record, so each log call costs
+    a write() syscall. Records below flush_level stay in a buffer_size
+    buffer; a record at or above it flushes everything written so far, a
+    background thread flushes every flush_interval seconds so an idle log
+    still catches up, and close() (run by logging.shutdown at exit)
+    drains the rest.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        flush_level: int = logging.ERROR,
+        flush_interval: float = FILE_LOG_FLUSH_INTERVAL,
+        buffer_size: int = FILE_LOG_BUFFER_SIZE,
+        **kwargs
+    ):
+        # Set before FileHandler.__init__, which opens the file via _open()
+        self.buffer_size = buffer_size
+        super().__init__(filename, **kwargs)
+        self.flush_level = flush_level
+        self._deferring = False
+        self._closing = threading.Event()
+
+        if flush_interval:
+            threading.Thread(
+                target=self._flush_periodically,
+                args=(flush_interval,),
+                name="log-file-flush",
+                daemon=True
+            ).start()
+
+    def _open(self):
+        return self._builtin_open(
+            self.baseFilename, self.mode, buffering=self.buffer_size,
+            encoding=self.encoding, errors=self.errors
+        )
+
+    def emit(self, record):
+        # Handler.handle holds self.lock here, and close()/flush() take it too
+        self._deferring = record.levelno < self.flush_level
+        try:
+            super().emit(record)
+        finally:
+            self._deferring = False
+
+    def flush(self):
+        if not self._deferring:
+            super().flush()
+
+    def close(self):
+        self._closing.set()
+        super().close()
+
+    def _flush_periodically(self, interval: float):
+        while not self._closing.wait(interval):
+            self.flush()
 
 
 def setup_logging(
@@ -42,59 +149,88 @@ def setup_logging(
     Returns:
         Configured logger instance
     """
-    # Clear any existing handlers
+    global _queue_listener, _queue_handler, _configured_with
     root_logger = logging.getLogger()
-    for handler in root_logger.handlers[:]:
-        root_logger.removeHandler(handler)
-
-    # Set logging level
     log_level = getattr(logging, level.upper(), logging.INFO)
-    root_logger.setLevel(log_level)
+    app_logger = logging.getLogger("pdf_processor")
 
-    # Create formatters
-    detailed_formatter = logging.Formatter(
-        fmt='%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    # Repeat calls with the same settings keep the running handlers
+    settings = (log_level, log_file, enable_colors)
+    if settings == _configured_with and _queue_handler in root_logger.handlers:
+        root_logger.setLevel(log_level)
+        return app_logger
+
+    if _queue_handler is None:
+        # Clear any existing handlers
+        for handler in root_logger.handlers[:]:
+            root_logger.removeHandler(handler)
+    else:
+        # Reconfiguring: replace only what an earlier call installed
+        root_logger.removeHandler(_queue_handler)
+        previous_handlers = _queue_listener.handlers if _queue_listener is not None else ()
+        _stop_queue_listener()
+        for handler in previous_handlers:
+            handler.close()
 
-    simple_formatter = logging.Formatter(
-        fmt='%(asctime)s - %(levelname)s - %(message)s',
-        datefmt='%H:%M:%S'
-    )
+    # Set logging level
+    root_logger.setLevel(log_level)
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
-    if enable_colors:
-        colored_formatter = ColoredFormatter(
-            fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%H:%M:%S'
-        )
-        console_handler.setFormatter(colored_formatter)
+    # Escape codes are only useful on a terminal, not in redirected output
+    if enable_colors and sys.stdout.isatty():
+        console_handler.setFormatter(_COLORED_FORMATTER)
     else:
-        console_handler.setFormatter(simple_formatter)
+        console_handler.setFormatter(_SIMPLE_FORMATTER)
 
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # File handler (if specified)
+    file_error = None
     if log_file:
         try:
-            # Create log directory if it doesn't exist
-            os.makedirs(os.path.dirname(log_file), exist_ok=True)
-
-            file_handler = logging.FileHandler(log_file)
-            file_handler.setFormatter(detailed_formatter)
-            root_logger.addHandler(file_handler)
-
-        except Exception as e:
-            root_logger.warning(f"Could not create file handler for {log_file}: {e}")
+            # Create log directory if it doesn't exist; a bare filename has none
+            log_dir = os.path.dirname(log_file)
+            if log_dir:
+                os.makedirs(log_dir, exist_ok=True)
+
+            file_handler = BufferedFileHandler(log_file)
+            file_handler.setFormatter(_DETAILED_FORMATTER)
+            handlers.append(file_handler)
+
+        except OSError as e:
+            file_error = e
+
+    # Handlers run on a listener thread, so logging calls only enqueue records
+    log_queue = queue.SimpleQueue()
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    root_logger.addHandler(_queue_handler)
+    _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+    # A file that failed to open is retried on the next call
+    _configured_with = settings if file_error is None else None
+
+    if file_error is not None:
+        root_logger.warning(f"Could not create file handler for {log_file}: {file_error}")
 
-    # Create application logger
-    app_logger = logging.getLogger("pdf_processor")
     app_logger.info(f"Logging initialized at level {level}")
 
     return app_logger
 
 
+def _stop_queue_listener():
+    """Drain queued records and stop the listener thread started by setup_logging"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+# Registered after logging's own shutdown hook, so it runs first and the
+# handlers are still open while the queue drains
+atexit.register(_stop_queue_listener)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a specific module.
@@ -111,35 +247,52 @@ def get_logger(name: str) -> logging.Logger:
 class LoggingMixin:
     """Mixin class to add logging capabilities to any class"""
 
+    # Resolved once per class; subclasses get their own in __init_subclass__.
+    # The helpers below read it directly rather than through the property
+    _logger = logging.getLogger(f"{__module__}.LoggingMixin")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._logger = logging.getLogger(f"{cls.__module__}.{cls.__name__}")
+
     @property
     def logger(self) -> logging.Logger:
         """Get logger for this class"""
-        return logging.getLogger(f"{self.__class__.__module__}.{self.__class__.__name__}")
+        return self._logger
 
     def log_method_entry(self, method_name: str, **kwargs):
         """Log method entry with parameters"""
+        logger = self._logger
+        # Building the parameter list costs more than the record, so skip it when suppressed
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         params = ', '.join(f"{k}={v}" for k, v in kwargs.items())
-        self.logger.debug(f"Entering {method_name}({params})")
+        logger.debug("Entering %s(%s)", method_name, params)
 
     def log_method_exit(self, method_name: str, result=None):
         """Log method exit with result"""
+        logger = self._logger
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         if result is not None:
-            self.logger.debug(f"Exiting {method_name} with result: {type(result).__name__}")
+            logger.debug("Exiting %s with result: %s", method_name, type(result).__name__)
         else:
-            self.logger.debug(f"Exiting {method_name}")
+            logger.debug("Exiting %s", method_name)
 
     def log_error(self, error: Exception, context: str = None):
         """Log error with context"""
         context_str = f" in {context}" if context else ""
-        self.logger.error(f"{type(error).__name__}{context_str}: {str(error)}")
+        self._logger.error("%s%s: %s", type(error).__name__, context_str, error)
 
     def log_warning(self, message: str, **kwargs):
         """Log warning with additional context"""
+        logger = self._logger
         if kwargs:
-            context = ', '.join(f"{k}={v}" for k, v in kwargs.items())
-            self.logger.warning(f"{message} ({context})")
+            if logger.isEnabledFor(logging.WARNING):
+                context = ', '.join(f"{k}={v}" for k, v in kwargs.items())
+                logger.warning("%s (%s)", message, context)
         else:
-            self.logger.warning(message)
+            logger.warning(message)
 
 
 def log_performance(func):
@@ -152,30 +305,31 @@ def log_performance(func):
     Returns:
         Decorated function
     """
+    # One logger per decorated function, not one lookup per call
+    logger = logging.getLogger(func.__module__)
+
+    @wraps(func)
     def wrapper(*args, **kwargs):
-        logger = logging.getLogger(func.__module__)
-        start_time = datetime.now()
+        start_time = time.perf_counter()
 
         try:
-            logger.debug(f"Starting {func.__name__}")
+            logger.debug("Starting %s", func.__name__)
             result = func(*args, **kwargs)
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
 
-            logger.info(f"{func.__name__} completed in {duration:.3f}s")
+            logger.info("%s completed in %.3fs", func.__name__, duration)
             return result
 
         except Exception as e:
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
 
-            logger.error(f"{func.__name__} failed after {duration:.3f}s: {str(e)}")
+            logger.error("%s failed after %.3fs: %s", func.__name__, duration, e)
             raise
 
     return wrapper
 
 
-async def log_async_performance(func):
+def log_async_performance(func):
     """
     Async decorator to log function performance metrics.
 
@@ -185,24 +339,25 @@ async def log_async_performance(func):
     Returns:
         Decorated async function
     """
+    # One logger per decorated function, not one lookup per call
+    logger = logging.getLogger(func.__module__)
+
+    @wraps(func)
     async def wrapper(*args, **kwargs):
-        logger = logging.getLogger(func.__module__)
-        start_time = datetime.now()
+        start_time = time.perf_counter()
 
         try:
-            logger.debug(f"Starting {func.__name__}")
+            logger.debug("Starting %s", func.__name__)
             result = await func(*args, **kwargs)
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
 
-            logger.info(f"{func.__name__} completed in {duration:.3f}s")
+            logger.info("%s completed in %.3fs", func.__name__, duration)
             return result
 
         except Exception as e:
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
 
-            logger.error(f"{func.__name__} failed after {duration:.3f}s: {str(e)}")
+            logger.error("%s failed after %.3fs: %s", func.__name__, duration, e)
             raise
 
     return wrapper
\ No newline at end of file
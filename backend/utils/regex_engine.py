@@ -0,0 +1,53 @@
+"""
+Regex engine selection with an optional RE2 backend.
+"""
+import re
+import logging
+
+try:
+    import re2
+except ImportError:
+    # google-re2 is optional; stdlib re is always available
+    re2 = None
+
+logger = logging.getLogger(__name__)
+
+RE2_AVAILABLE = re2 is not None
+
+# Flags RE2 understands as inline modifiers
+_INLINE_FLAGS = (
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+)
+_SUPPORTED_FLAGS = re.IGNORECASE | re.MULTILINE | re.DOTALL
+
+
+def compile_linear(pattern: str, flags: int = 0):
+    """
+    Compile a pattern with RE2 when available, falling back to stdlib re.
+
+    RE2 matches in time linear in the input, so patterns built from
+    \\s* runs and alternations cannot backtrack pathologically on
+    adversarial PDF text. Patterns RE2 rejects (backreferences,
+    lookarounds) or flags it cannot express fall back to re.
+
+    RE2 pays off on mostly-failing scans such as detection patterns. For
+    scans that produce many matches the Python wrapper's per-match
+    overhead dominates, and stdlib re is faster.
+
+    Args:
+        pattern: Regular expression source
+        flags: re module flags (IGNORECASE, MULTILINE, DOTALL)
+
+    Returns:
+        Compiled pattern exposing search/match/finditer/findall/sub
+    """
+    if re2 is not None and not flags & ~_SUPPORTED_FLAGS:
+        inline = "".join(letter for flag, letter in _INLINE_FLAGS if flags & flag)
+        try:
+            return re2.compile(f"(?{inline}){pattern}" if inline else pattern)
+        except re2.error as e:
+            logger.debug(f"RE2 rejected pattern {pattern!r}, using re: {e}")
+
+    return re.compile(pattern, flags)